@@ -1,69 +1,285 @@
 import os
+import io
+import re
+import sys
+import html
 import glob
-from bs4 import BeautifulSoup
+import itertools
+from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+from lxml import etree
 import json
+import pickle
+import logging
 
-def build_database():
-    base_dir = "/usr/share/doc/arch-wiki/html/en/"
+# orjson is much faster at serializing the final app list; fall back to the stdlib if it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-    # The offline wiki saves subpages either in a folder, with underscores, or URL-encoded %2F
-    print("Hunting for Arch Wiki application sub-pages...")
-    files_to_parse = glob.glob(os.path.join(base_dir, "List_of_applications*.html")) + \
-                     glob.glob(os.path.join(base_dir, "List_of_applications", "*.html")) + \
-                     glob.glob(os.path.join(base_dir, "List_of_applications%2F*.html"))
+log = logging.getLogger("build_db")
 
-    # Remove any duplicates just in case
-    files_to_parse = list(set(files_to_parse))
+# Compiled once at import and reused for every tag in the parse loop
+HEADLINE_XPATH = etree.XPath('.//*[contains(concat(" ", normalize-space(@class), " "), " mw-headline ")]')
+A_XPATH = etree.XPath('(.//a)[1]')
+B_XPATH = etree.XPath('(.//b)[1]')
 
-    if not files_to_parse:
-        print("Error: Could not find the application sub-pages.")
-        return
+# Whitespace and the dash separators between an app's name and its description
+STRIP_CHARS = " \t\n—–-"
 
-    db = {"apps": []}
+# Keep descriptions concise
+MAX_DESC_LEN = 150
 
-    for html_path in files_to_parse:
-        print(f" -> Parsing {os.path.basename(html_path)}...")
-        try:
-            with open(html_path, "r", encoding="utf-8") as f:
-                soup = BeautifulSoup(f, "lxml")
-        except FileNotFoundError:
+# Regex fast path for the flat heading/list markup the wiki generates
+HEADING_OR_ITEM_RE = re.compile(rb'<h([234])\b[^>]*>(.*?)</h\1>|<li\b[^>]*>(.*?)</li>', re.S)
+HEADLINE_RE = re.compile(rb'<span\b[^>]*class="(?:[^"]*\s)?mw-headline(?:\s[^"]*)?"[^>]*>(.*?)</span>', re.S)
+BOLD_RE = re.compile(rb'<b\b[^>]*>(.*?)</b>', re.S)
+LINK_RE = re.compile(rb'<a\b[^>]*>(.*?)</a>', re.S)
+NESTED_ITEM_RE = re.compile(rb'<li\b')
+TAG_RE = re.compile(rb'<[^>]*>')
+
+# The article pane; navigation, sidebars and footers outside it only contribute junk <li>s
+CONTENT_RE = re.compile(rb'<div\b[^>]*\bid="mw-content-text"[^>]*>')
+DIV_RE = re.compile(rb'<(/?)div\b[^>]*>')
+
+def content_span(data):
+    """Return the (start, end) byte range of div#mw-content-text, or the whole page if it has none."""
+    opening = CONTENT_RE.search(data)
+    if not opening:
+        return 0, len(data)
+
+    depth = 1
+    for match in DIV_RE.finditer(data, opening.end()):
+        depth += -1 if match.group(1) else 1
+        if depth == 0:
+            return opening.end(), match.start()
+    return opening.end(), len(data)
+
+def _text(fragment):
+    return html.unescape(TAG_RE.sub(b"", fragment).decode("utf-8", "replace"))
+
+def _description(text, app_name):
+    # The name almost always opens the item, so a prefix check + slice avoids searching the whole text.
+    # The result is already cut to MAX_DESC_LEN, so the filter and the append both see the final string.
+    text = text.lstrip(STRIP_CHARS)
+    if text.startswith(app_name):
+        text = text[len(app_name):]
+    else:
+        text = text.replace(app_name, "", 1)
+    return text.strip(STRIP_CHARS)[:MAX_DESC_LEN]
+
+def _lower(s):
+    # Most package names are already lowercase; islower() is a cheap scan that skips the copy
+    return s if s.islower() else s.lower()
+
+def _is_app(app_name, description):
+    # Filter out garbage data: Needs a name, a decent description, and no massive spaces in the package name
+    return app_name and 5 < len(description) and len(app_name) < 30 and "\n" not in app_name
+
+def scan_page(data):
+    """Extract apps straight from the page bytes with regexes, or return None if the page needs a real parser."""
+    names, descs, cat_ids = [], [], []
+    cat_to_id = {}
+    current_category = "General"
+
+    for match in HEADING_OR_ITEM_RE.finditer(data):
+        heading, item = match.group(2), match.group(3)
+
+        if item is None:
+            headline = HEADLINE_RE.search(heading)
+            if headline:
+                current_category = sys.intern(_text(headline.group(1)).strip())
             continue
 
-        current_category = "General"
+        # A nested list means the lazy </li> match cut the outer item short
+        if NESTED_ITEM_RE.search(item):
+            return None
+
+        link = LINK_RE.search(item)
+        if link:
+            bold = BOLD_RE.search(item)
+            app_name = _text((bold or link).group(1)).strip()
+            description = _description(_text(item), app_name)
+
+            if _is_app(app_name, description):
+                names.append(_lower(app_name))
+                descs.append(description)
+                cat_ids.append(cat_to_id.setdefault(current_category, len(cat_to_id)))
 
-        for tag in soup.find_all(['h2', 'h3', 'h4', 'li']):
+    if not names:
+        return None
+    return names, descs, cat_ids, list(cat_to_id)
+
+def parse_page(data):
+    """Extract apps by stream-parsing the page with lxml."""
+    names, descs, cat_ids = [], [], []
+    cat_to_id = {}
+    current_category = "General"
+
+    # Stream the page instead of building the whole DOM, releasing each element once handled
+    try:
+        events = etree.iterparse(io.BytesIO(data), tag=('h2', 'h3', 'h4', 'li'), html=True, encoding="utf-8")
+        for _, tag in events:
             # Update category when we hit a heading
-            if tag.name in ['h2', 'h3', 'h4']:
-                headline = tag.find(class_="mw-headline")
+            if tag.tag in ['h2', 'h3', 'h4']:
+                headline = HEADLINE_XPATH(tag)
                 if headline:
-                    current_category = headline.text.strip()
+                    current_category = sys.intern("".join(headline[0].itertext()).strip())
 
             # Extract the app when we hit a list item
-            elif tag.name == 'li':
-                a_tag = tag.find('a')
+            elif tag.tag == 'li':
+                a_tag = A_XPATH(tag)
                 # Arch Wiki usually bolds the package name in these lists
-                b_tag = tag.find('b')
+                b_tag = B_XPATH(tag)
 
-                if a_tag and tag.text:
+                if a_tag:
                     # Prefer the bolded text, fallback to the link text
-                    app_name = b_tag.text.strip() if b_tag else a_tag.text.strip()
-                    description = tag.text.replace(app_name, "", 1).strip(" \t\n—–-")
+                    name_tag = (b_tag or a_tag)[0]
+                    app_name = "".join(name_tag.itertext()).strip()
+
+                    # "<li><b>Name</b> — description</li>": the name's tail already is the whole description
+                    if name_tag.getparent() is tag and name_tag.getnext() is None and not (tag.text or "").strip():
+                        description = (name_tag.tail or "").strip(STRIP_CHARS)[:MAX_DESC_LEN]
+                    else:
+                        description = _description("".join(tag.itertext()), app_name)
+
+                    if _is_app(app_name, description):
+                        names.append(_lower(app_name))
+                        descs.append(description)
+                        cat_ids.append(cat_to_id.setdefault(current_category, len(cat_to_id)))
+
+            tag.clear()
+            while tag.getprevious() is not None:
+                del tag.getparent()[0]
+    except etree.XMLSyntaxError:
+        # Keep whatever was extracted before the page became unreadable
+        pass
 
-                    # Filter out garbage data: Needs a name, a decent description, and no massive spaces in the package name
-                    if app_name and len(description) > 5 and len(app_name) < 30 and "\n" not in app_name:
-                        db["apps"].append({
-                            "name": app_name.lower(),
-                            "desc": description[:150], # Keep descriptions concise
-                            "category": current_category
-                        })
+    return names, descs, cat_ids, list(cat_to_id)
+
+def parse_one(path_and_name):
+    """Extract one List_of_applications page as (names, descs, cat_ids, categories) columns.
+
+    Each row stores an index into the page's categories table instead of its own copy of the string.
+    """
+    html_path, name = path_and_name
+    try:
+        with open(html_path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        log.warning(f" -> Skipping {name}: {e}")
+        return [], [], [], []
+
+    # Only the article pane holds application lists
+    start, end = content_span(data)
+    if (start, end) != (0, len(data)):
+        data = data[start:end]
+
+    # Well-formed wiki output goes through the regex scanner; anything else falls back to lxml
+    return scan_page(data) or parse_page(data)
+
+# Bump whenever the extraction logic changes so stale cached pages are re-parsed
+CACHE_VERSION = 2
+
+def load_cache(cache_path):
+    """Return the {path: ((mtime_ns, size), columns)} map saved by the previous build, or an empty one."""
+    try:
+        with open(cache_path, "rb") as f:
+            version, pages = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        return {}
+    return pages if version == CACHE_VERSION else {}
+
+@dataclass(slots=True)
+class App:
+    name: str
+    desc: str
+    category: str
+
+def iter_apps(pages):
+    """Yield the rows of each page's columns in order, materializing one App at a time."""
+    for page_names, page_descs, page_cat_ids, page_cats in pages:
+        # Every row in a category shares the same interned string
+        page_cats = [sys.intern(c) for c in page_cats]
+        for name, desc, cat_id in zip(page_names, page_descs, page_cat_ids):
+            yield App(name, desc, page_cats[cat_id])
+
+def build_database():
+    base_dir = "/usr/share/doc/arch-wiki/html/en/"
+
+    # The offline wiki saves subpages either in a folder, with underscores, or URL-encoded %2F
+    log.info("Hunting for Arch Wiki application sub-pages...")
+    patterns = [os.path.join(base_dir, "List_of_applications*.html"),
+                os.path.join(base_dir, "List_of_applications", "*.html"),
+                os.path.join(base_dir, "List_of_applications%2F*.html")]
+
+    # Remove duplicates by inode, so a page reachable through a symlink or a second pattern is only parsed once
+    seen = {}
+    for path in itertools.chain.from_iterable(glob.iglob(p) for p in patterns):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        seen.setdefault((st.st_dev, st.st_ino), (path, st))
+    # Pair each page with its basename once, so neither the workers nor the log lines re-split the path
+    files_to_parse = [(path, os.path.basename(path)) for path, _ in seen.values()]
+    stamps = {path: (st.st_mtime_ns, st.st_size) for path, st in seen.values()}
+
+    if not files_to_parse:
+        log.error("Error: Could not find the application sub-pages.")
+        return
 
     script_dir = os.path.dirname(os.path.realpath(__file__))
     output_path = os.path.join(script_dir, "data", "real_db.json")
+    cache_path = os.path.join(script_dir, "data", "parse_cache.pickle")
+
+    # Pages only change when arch-wiki-docs is upgraded, so reuse last build's results for untouched files
+    cache = load_cache(cache_path)
+    pages = {path: cache[path][1] for path, _ in files_to_parse
+             if path in cache and cache[path][0] == stamps[path]}
+    stale = [(path, name) for path, name in files_to_parse if path not in pages]
+    if pages:
+        log.info(f" -> Reusing {len(pages)} unchanged pages from the parse cache")
+
+    # Pages are independent, so parse them on every core and merge in the main process
+    if stale:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            for (html_path, name), columns in zip(stale, ex.map(parse_one, stale, chunksize=1)):
+                log.info(f" -> Parsed {name} ({len(columns[0])} apps)")
+                pages[html_path] = columns
+
+    with open(cache_path, "wb") as f:
+        pickle.dump((CACHE_VERSION, {path: (stamps[path], pages[path]) for path, _ in files_to_parse}), f, protocol=5)
+
+    # Stream rows straight into the file instead of building the whole {"apps": [...]} tree first
+    # orjson serializes slotted dataclasses natively, reading the slots directly
+    if orjson is not None:
+        dumps = orjson.dumps
+    else:
+        dumps = lambda app: json.dumps(asdict(app), ensure_ascii=False).encode("utf-8")
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(db, f, indent=4)
+    # Write next to the real file and rename over it, so readers only ever see a complete database
+    tmp_path = output_path + ".tmp"
+    count = 0
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(b'{"apps": [')
+            for app in iter_apps(pages[path] for path, _ in files_to_parse):
+                f.write(b",\n    " if count else b"\n    ")
+                f.write(dumps(app))
+                count += 1
+            f.write(b"\n]}\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
-    print(f"\nSUCCESS! Extracted {len(db['apps'])} applications into data/real_db.json")
+    log.info(f"\nSUCCESS! Extracted {count} applications into data/real_db.json")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     build_database()
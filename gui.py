@@ -1,59 +1,271 @@
 import sys
 import os
+import atexit
+import re
 import json
+import bisect
 import subprocess
+import selectors
 import shutil
-import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+import threading
+import weakref
+from pathlib import Path
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from itertools import islice
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-    QLineEdit, QPushButton, QScrollArea, QLabel, QFrame,
-    QGraphicsDropShadowEffect, QDialog, QTextEdit, QSizePolicy, QMessageBox
+    QLineEdit, QPushButton, QLabel, QFrame, QListView, QAbstractItemView,
+    QStyledItemDelegate, QStyle, QDialog, QTextEdit, QSizePolicy, QMessageBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QByteArray, QTimer
-from PyQt6.QtGui import QColor, QPainter, QBrush, QPixmap, QFont
+from PyQt6.QtCore import (
+    Qt, QThread, QThreadPool, QProcess, QRunnable, QObject, pyqtSignal, QByteArray, QTimer,
+    QAbstractListModel, QModelIndex, QSignalMapper, QEvent, QSize, QRect, QRectF, QPointF
+)
+from PyQt6 import sip
+from PyQt6.QtGui import (
+    QColor, QPainter, QPainterPath, QPixmapCache, QBrush, QPen, QPixmap, QFont, QFontMetrics, QTextCursor, QLinearGradient
+)
+
+# ══════════════════════════════════════════════════════
+#  HTTP SESSION
+# ══════════════════════════════════════════════════════
+
+# One keep-alive session for everything, so repeat requests to
+# archlinux.org, aur.archlinux.org and the icon service reuse their TLS connections.
+# requests (urllib3, certifi) is over half of the import time, so it is only
+# loaded once the first worker needs the network, not while the window opens.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def http_session():
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            _SESSION = requests.Session()
+            _SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
+            _SESSION.headers["User-Agent"] = "aura-find/1.1"
+        return _SESSION
 
 
 # ══════════════════════════════════════════════════════
 #  LOGO HELPERS
 # ══════════════════════════════════════════════════════
 
-def fetch_logo(pkg_name: str, size: int = 48) -> "QPixmap | None":
-    base = pkg_name.lower().split("-")[0].split("_")[0]
-    for domain in [f"{base}.org", f"{base}.com"]:
+def fetch_icon_bytes(domain: str) -> "bytes | None":
+    r = http_session().get(
+        f"https://icons.duckduckgo.com/ip3/{domain}.ico",
+        headers={"Accept": "image/*"},
+        timeout=1.5
+    )
+    if r.status_code == 200 and len(r.content) > 200:
+        return r.content
+    return None
+
+
+# Logos are cached per base name: in memory for this session, and as PNGs on
+# disk so they survive restarts. Bases with no icon on either domain go in
+# logo_misses.txt ("base,timestamp" per line) and skip the network entirely.
+_LOGO_MEM: dict = {}
+_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")) / "aura-find"
+_LOGO_DIR = _CACHE_DIR / "logos"
+_LOGO_MISS_FILE = _CACHE_DIR / "logo_misses.txt"
+_LOGO_MISS_TTL = 30 * 24 * 60 * 60   # retry bases that had no icon after a month
+_LOGO_MISS: "dict | None" = None     # base -> time of the failed fetch, loaded on first use
+_LOGO_MISS_LOCK = threading.Lock()
+_LOGO_INFLIGHT: dict = {}   # (base, size) -> Future of the fetch already running
+_LOGO_INFLIGHT_LOCK = threading.Lock()
+
+# Long-lived pools reused by every search instead of spinning up threads each time.
+# fetch_logo runs as a LogoTask on _LOGO_THREADS and waits on its two requests in
+# _ICON_POOL — separate pools so those inner requests can never queue behind their parents.
+# A search's AUR lookup gets _AUR_POOL to itself for the same reason: it must never
+# wait behind a page of icon requests, least of all ones left over from the last search.
+_LOGO_THREADS = QThreadPool()
+_LOGO_THREADS.setMaxThreadCount(8)
+_ICON_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="icon")
+_AUR_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="aur")
+atexit.register(_ICON_POOL.shutdown, wait=False)
+atexit.register(_AUR_POOL.shutdown, wait=False)
+
+
+def _load_logo_misses() -> dict:
+    """Read the known-miss file once, dropping (and rewriting away) expired entries."""
+    global _LOGO_MISS
+    with _LOGO_MISS_LOCK:
+        if _LOGO_MISS is not None:
+            return _LOGO_MISS
+        misses, expired = {}, False
+        cutoff = time.time() - _LOGO_MISS_TTL
         try:
-            r = requests.get(
-                f"https://icons.duckduckgo.com/ip3/{domain}.ico",
-                timeout=1.5
-            )
-            if r.status_code == 200 and len(r.content) > 200:
-                px = QPixmap()
-                px.loadFromData(QByteArray(r.content))
-                if not px.isNull() and px.width() > 8:
-                    return px.scaled(size, size,
-                                     Qt.AspectRatioMode.KeepAspectRatio,
-                                     Qt.TransformationMode.SmoothTransformation)
-        except Exception:
+            with open(_LOGO_MISS_FILE, encoding="utf-8") as f:
+                for line in f:
+                    base, _, stamp = line.strip().rpartition(",")
+                    try:
+                        when = float(stamp)
+                    except ValueError:
+                        continue
+                    if when >= cutoff:
+                        misses[base] = when
+                    else:
+                        expired = True
+        except OSError:
+            pass
+        if expired:
+            try:
+                with open(_LOGO_MISS_FILE, "w", encoding="utf-8") as f:
+                    f.writelines(f"{b},{t:.0f}\n" for b, t in misses.items())
+            except OSError:
+                pass
+        _LOGO_MISS = misses
+        return misses
+
+
+def _remember_logo_miss(base: str):
+    now = time.time()
+    misses = _load_logo_misses()
+    with _LOGO_MISS_LOCK:
+        misses[base] = now
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(_LOGO_MISS_FILE, "a", encoding="utf-8") as f:
+                f.write(f"{base},{now:.0f}\n")
+        except OSError:
             pass
+
+
+def _scaled(px: QPixmap, size: int) -> QPixmap:
+    return px.scaled(size, size,
+                     Qt.AspectRatioMode.KeepAspectRatio,
+                     Qt.TransformationMode.SmoothTransformation)
+
+
+def logo_base(pkg_name: str) -> str:
+    """The name a package's logo is looked up by — python-foo and python-bar share python."""
+    return pkg_name.lower().split("-")[0].split("_")[0]
+
+
+def cached_logo(pkg_name: str, size: int = 48) -> "QPixmap | None":
+    """The logo if this session already fetched it, without touching disk or network."""
+    return _LOGO_MEM.get((logo_base(pkg_name), size))
+
+
+def fetch_logo(pkg_name: str, size: int = 48) -> "QPixmap | None":
+    """Fetch a logo, or wait on the fetch another thread already started for the same base."""
+    key = (logo_base(pkg_name), size)
+    with _LOGO_INFLIGHT_LOCK:
+        future = _LOGO_INFLIGHT.get(key)
+        owner = future is None
+        if owner:
+            future = _LOGO_INFLIGHT[key] = Future()
+    if not owner:
+        return future.result()
+    try:
+        px = _fetch_logo(*key)
+    except Exception:
+        px = None
+    finally:
+        with _LOGO_INFLIGHT_LOCK:
+            del _LOGO_INFLIGHT[key]
+    future.set_result(px)
+    return px
+
+
+def _fetch_logo(base: str, size: int) -> "QPixmap | None":
+    # 1. Memory, then disk
+    cached = _LOGO_MEM.get((base, size))
+    if cached is not None:
+        return cached
+    png_path = _LOGO_DIR / f"{base}.png"
+    if png_path.exists():
+        px = QPixmap(str(png_path))
+        if not px.isNull():
+            _LOGO_MEM[(base, size)] = _scaled(px, size)
+            return _LOGO_MEM[(base, size)]
+
+    # Known misses never touch the network
+    if time.time() - _load_logo_misses().get(base, 0) < _LOGO_MISS_TTL:
+        return None
+
+    # 2. Network — ask for both domains at once, so a dead .org no longer
+    #    costs a full timeout before .com is tried
+    futures = [_ICON_POOL.submit(fetch_icon_bytes, d) for d in [f"{base}.org", f"{base}.com"]]
+    answered = 0   # domains that replied, with or without an icon
+    try:
+        for future in as_completed(futures):
+            try:
+                data = future.result()
+                answered += 1
+                if data:
+                    px = QPixmap()
+                    px.loadFromData(QByteArray(data))
+                    if not px.isNull() and px.width() > 8:
+                        try:
+                            _LOGO_DIR.mkdir(parents=True, exist_ok=True)
+                            px.save(str(png_path), "PNG")
+                        except OSError:
+                            pass
+                        _LOGO_MEM[(base, size)] = _scaled(px, size)
+                        return _LOGO_MEM[(base, size)]
+            except Exception:
+                pass
+    finally:
+        # Don't wait on the loser
+        for future in futures:
+            future.cancel()
+
+    # A timeout or dropped connection says nothing about the icon — only a real
+    # answer from both domains is worth remembering for a month
+    if answered == len(futures):
+        _remember_logo_miss(base)
     return None
 
 
+# Rounded logos keyed on the source pixmap's cacheKey(); fetch_logo hands out the same
+# QPixmap for every package sharing a logo base, so repeat logos are only painted once
+_ROUNDED: dict = {}
+_ROUNDED_MAX = 256
+
+
 def rounded_pixmap(src: QPixmap, size: int, radius: int) -> QPixmap:
-    scaled = src.scaled(size, size,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation)
+    key = (src.cacheKey(), size, radius)
+    px = _ROUNDED.get(key)
+    if px is None:
+        if len(_ROUNDED) >= _ROUNDED_MAX:
+            _ROUNDED.clear()
+        px = _ROUNDED[key] = _rounded_pixmap(src, size, radius)
+    return px
+
+
+def _rounded_pixmap(src: QPixmap, size: int, radius: int) -> QPixmap:
     result = QPixmap(size, size)
     result.fill(Qt.GlobalColor.transparent)
+    # Scale straight into the clipped target instead of via an intermediate scaled copy
+    fit = src.size().scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio)
+    target = QRect((size - fit.width()) // 2, (size - fit.height()) // 2, fit.width(), fit.height())
+    path = QPainterPath()
+    path.addRoundedRect(QRectF(0, 0, size, size), radius, radius)
     p = QPainter(result)
     p.setRenderHint(QPainter.RenderHint.Antialiasing)
-    p.setBrush(QBrush(scaled))
-    p.setPen(Qt.PenStyle.NoPen)
-    p.drawRoundedRect(0, 0, size, size, radius, radius)
+    p.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+    p.setClipPath(path)
+    p.drawPixmap(target, src)
     p.end()
     return result
 
 
 def placeholder_pixmap(letter: str, color: str, size: int = 48) -> QPixmap:
+    # Only the first letter is drawn, so cards sharing it (and a colour) share one pixmap
+    return _placeholder_pixmap(letter.upper()[:1], color, size)
+
+
+@lru_cache(maxsize=256)
+def _placeholder_pixmap(letter: str, color: str, size: int) -> QPixmap:
     px = QPixmap(size, size)
     px.fill(Qt.GlobalColor.transparent)
     p = QPainter(px)
@@ -65,7 +277,7 @@ def placeholder_pixmap(letter: str, color: str, size: int = 48) -> QPixmap:
     f = QFont("JetBrains Mono", size // 3)
     f.setBold(True)
     p.setFont(f)
-    p.drawText(px.rect(), Qt.AlignmentFlag.AlignCenter, letter.upper()[:1])
+    p.drawText(px.rect(), Qt.AlignmentFlag.AlignCenter, letter)
     p.end()
     return px
 
@@ -74,131 +286,352 @@ def placeholder_pixmap(letter: str, color: str, size: int = 48) -> QPixmap:
 #  OFFLINE SEARCH
 # ══════════════════════════════════════════════════════
 
-def search_offline(query: str) -> list:
+# (mtime, rows, index, vocab) of the last load:
+#   rows  — (name_lc, desc_lc, cat_lc, app) per app
+#   index — token -> set of row numbers whose name/desc/category contain it
+#   vocab — sorted index keys, for prefix lookups with bisect
+_DB_CACHE: "tuple | None" = None
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def load_offline_db() -> tuple:
+    """Parsed offline DB plus its token index, re-read only when the file changes."""
+    global _DB_CACHE
     script_dir = os.path.dirname(os.path.realpath(__file__))
     json_path = os.path.join(script_dir, "data", "real_db.json")
-    if not os.path.exists(json_path):
-        return []
+    try:
+        mtime = os.stat(json_path).st_mtime
+    except OSError:
+        return [], {}, []
+    if _DB_CACHE and _DB_CACHE[0] == mtime:
+        return _DB_CACHE[1:]
     try:
         with open(json_path, "r", encoding="utf-8") as f:
             db = json.load(f)
     except Exception:
-        return []
+        return [], {}, []
+    rows = [
+        (app.get("name", "").lower(),
+         app.get("desc", "").lower(),
+         app.get("category", "").lower(),
+         app)
+        for app in db.get("apps", [])
+    ]
+    index = defaultdict(set)
+    for i, (name_lc, desc_lc, cat_lc, _) in enumerate(rows):
+        for token in _TOKEN_RE.findall(f"{name_lc} {desc_lc} {cat_lc}"):
+            index[token].add(i)
+    _DB_CACHE = (mtime, rows, dict(index), sorted(index))
+    return _DB_CACHE[1:]
+
+
+def _token_hits(token: str, index: dict, vocab: list) -> set:
+    """Rows containing any word that starts with token."""
+    hits = set()
+    start = bisect.bisect_left(vocab, token)
+    for word in vocab[start:]:
+        if not word.startswith(token):
+            break
+        hits |= index[word]
+    return hits
+
+
+def search_offline(query: str, limit: int = 12) -> list:
     q = query.lower()
+    rows, index, vocab = load_offline_db()
+
+    # Every query word must prefix-match some word of the app. Queries with
+    # punctuation ("c++", "gtk-") aren't plain words, and one or two letters
+    # prefix most of the vocabulary, so those skip the index.
+    tokens = _TOKEN_RE.findall(q)
+    matches = set()
+    if len(q) > 2 and " ".join(tokens) == " ".join(q.split()):
+        for i, token in enumerate(tokens):
+            hits = _token_hits(token, index, vocab)
+            matches = hits if i == 0 else matches & hits
+            if not matches:
+                break
+
+    # Top up with plain substring hits the word index can't see ("office" inside "libreoffice")
+    picked = sorted(matches)[:limit]
+    if len(picked) < limit:
+        picked += islice((i for i, (name_lc, desc_lc, cat_lc, _) in enumerate(rows)
+                          if i not in matches and (q in name_lc or q in desc_lc or q in cat_lc)),
+                         limit - len(picked))
+
     results = []
-    for app in db.get("apps", []):
-        if (q in app.get("name", "").lower() or
-                q in app.get("desc", "").lower() or
-                q in app.get("category", "").lower()):
+    for name_lc, _, _, app in (rows[i] for i in picked):
+        results.append({
+            "name":   app.get("name", ""),
+            "repo":   app.get("category", "Wiki"),
+            "desc":   app.get("desc", "No description."),
+            "source": "offline",
+            # Already lowercased by load_offline_db — SearchWorker dedupes on it, then drops it
+            "_name_lc": name_lc,
+        })
+    return results
+
+
+# ══════════════════════════════════════════════════════
+#  ONLINE SEARCH
+# ══════════════════════════════════════════════════════
+
+@lru_cache(maxsize=1)
+def _ijson():
+    # Optional, and only imported with the first search, like requests itself
+    try:
+        import ijson
+    except ImportError:
+        return None
+    return ijson
+
+
+def first_results(url: str, limit: int = 10) -> "list | None":
+    """First `limit` entries of a search response's "results" array, or None on an HTTP error.
+
+    With ijson the body is parsed as it streams in and dropped after the last
+    needed entry; without it, falls back to decoding the whole response.
+    """
+    ijson = _ijson()
+    with http_session().get(url, timeout=5, stream=True) as r:
+        if r.status_code != 200:
+            return None
+        if ijson is None:
+            return r.json().get("results", [])[:limit]
+        r.raw.decode_content = True
+        return list(islice(ijson.items(r.raw, "results.item"), limit))
+
+
+def search_arch(query: str) -> "list | None":
+    """None if the lookup failed, so an outage is never mistaken for no matches."""
+    results = []
+    try:
+        found = first_results(f"https://archlinux.org/packages/search/json/?q={query}")
+        if found is None:
+            return None
+        for pkg in found:
             results.append({
-                "name":   app.get("name", ""),
-                "repo":   app.get("category", "Wiki"),
-                "desc":   app.get("desc", "No description."),
-                "source": "offline",
+                "name":   pkg.get("pkgname", ""),
+                "repo":   pkg.get("repo", "official"),
+                "desc":   pkg.get("pkgdesc", "No description."),
+                "source": "online",
             })
-    return results[:12]
+    except Exception:
+        return None
+    return results
+
+
+def search_aur(query: str) -> "list | None":
+    """Like search_arch, against the AUR RPC."""
+    results = []
+    try:
+        found = first_results(f"https://aur.archlinux.org/rpc/?v=5&type=search&arg={query}")
+        if found is None:
+            return None
+        for pkg in found:
+            results.append({
+                "name":   pkg.get("Name", ""),
+                "repo":   "AUR",
+                "desc":   pkg.get("Description", "No description."),
+                "source": "online",
+            })
+    except Exception:
+        return None
+    return results
 
 
 # ══════════════════════════════════════════════════════
-#  WORKER 1 — Search (carries search_id to detect stale results)
+#  SEARCH CACHE — finished results per normalized query, plus the searches
+#  waiting on a lookup that is already running (both touched on the GUI thread only)
 # ══════════════════════════════════════════════════════
 
-class SearchWorker(QThread):
-    # Emits (search_id, results) so the UI can discard old ones
-    results_ready = pyqtSignal(int, list)
+_SEARCH_CACHE: OrderedDict = OrderedDict()   # query -> results, least recently used first
+_SEARCH_CACHE_MAX = 128
+_SEARCH_INFLIGHT: dict = {}                  # query -> [search_id, ...] awaiting its worker
+
+
+def cache_results(query: str, results: list):
+    _SEARCH_CACHE[query] = results
+    _SEARCH_CACHE.move_to_end(query)
+    if len(_SEARCH_CACHE) > _SEARCH_CACHE_MAX:
+        _SEARCH_CACHE.popitem(last=False)
+
+
+def cached_results(query: str) -> "list | None":
+    results = _SEARCH_CACHE.get(query)
+    if results is not None:
+        _SEARCH_CACHE.move_to_end(query)
+    return results
 
-    def __init__(self, query: str, search_id: int):
+
+# ══════════════════════════════════════════════════════
+#  WORKER SIGNALS — QRunnable isn't a QObject, so the pooled workers below
+#  emit through one long-lived instance owned by the main window
+# ══════════════════════════════════════════════════════
+
+class WorkerSignals(QObject):
+    # Both carry search_id so the UI can discard results from older searches
+    results_ready = pyqtSignal(int, str, list, bool)  # (search_id, query, results, complete)
+    logos_ready   = pyqtSignal(int, object)       # (search_id, LogoBatch)
+
+
+# ══════════════════════════════════════════════════════
+#  WORKER 1 — Search (runs on the global QThreadPool, carries search_id)
+# ══════════════════════════════════════════════════════
+
+class SearchWorker(QRunnable):
+    def __init__(self, query: str, search_id: int, signals: WorkerSignals,
+                 cancelled: threading.Event):
         super().__init__()
         self.query = query
         self.search_id = search_id
+        self.signals = signals
+        # Set once a newer search supersedes this one; checked after every lookup
+        self.cancelled = cancelled
+        self.setAutoDelete(True)
 
     def run(self):
-        results = []
-
-        try:
-            r = requests.get(
-                f"https://archlinux.org/packages/search/json/?q={self.query}",
-                timeout=5)
-            if r.status_code == 200:
-                for pkg in r.json().get("results", [])[:10]:
-                    results.append({
-                        "name":   pkg.get("pkgname", ""),
-                        "repo":   pkg.get("repo", "official"),
-                        "desc":   pkg.get("pkgdesc", "No description."),
-                        "source": "online",
-                    })
-        except Exception:
-            pass
-
-        try:
-            r = requests.get(
-                f"https://aur.archlinux.org/rpc/?v=5&type=search&arg={self.query}",
-                timeout=5)
-            if r.status_code == 200:
-                for pkg in r.json().get("results", [])[:10]:
-                    results.append({
-                        "name":   pkg.get("Name", ""),
-                        "repo":   "AUR",
-                        "desc":   pkg.get("Description", "No description."),
-                        "source": "online",
-                    })
-        except Exception:
-            pass
+        # Superseded while still queued — don't start either lookup
+        if self.cancelled.is_set():
+            return
+        # Both lookups are independent round-trips — AUR goes to its own pool
+        # while this thread asks the official repos, so the wait is the slower of the two
+        aur = _AUR_POOL.submit(search_aur, self.query)
+        # Official repos first, then AUR — same order as before
+        arch = search_arch(self.query)
+        if self.cancelled.is_set():
+            aur.cancel()
+            return
+        online = [arch, aur.result()]
+        if self.cancelled.is_set():
+            return
+        # A failed lookup still shows what the other one and the wiki found,
+        # but the answer isn't complete enough to be cached
+        complete = None not in online
+        results = [pkg for found in online if found for pkg in found]
 
-        online_names = {r["name"].lower() for r in results}
+        online_names = set(r["name"].lower() for r in results)
         for pkg in search_offline(self.query):
-            if pkg["name"].lower() not in online_names:
+            if pkg.pop("_name_lc") not in online_names:
                 results.append(pkg)
 
-        self.results_ready.emit(self.search_id, results)
+        if not self.cancelled.is_set():
+            self.signals.results_ready.emit(self.search_id, self.query, results, complete)
 
 
 # ══════════════════════════════════════════════════════
-#  WORKER 2 — Logo loader (parallel, per-card signals, also carries search_id)
+#  WORKER 2 — Logo loader (one pooled task per logo base, also carries search_id)
 # ══════════════════════════════════════════════════════
 
-class LogoWorker(QThread):
-    logo_ready = pyqtSignal(int, str, QPixmap)   # (search_id, pkg_name, pixmap)
+class LogoBatch:
+    """Logos fetched for one search, waiting to be picked up by the UI thread.
 
-    def __init__(self, names: list, search_id: int):
-        super().__init__()
-        self.names = names
+    Only the task that finds the batch empty emits; by the time the queued signal
+    is delivered, everything fetched meanwhile goes onto the rows in one pass.
+    """
+
+    def __init__(self, search_id: int, signals: WorkerSignals):
         self.search_id = search_id
-        self._stop = False
+        self.signals = signals
+        self._items: list = []   # (pkg_name, pixmap)
+        self._lock = threading.Lock()
+
+    def add(self, items: list):
+        with self._lock:
+            notify = not self._items
+            self._items.extend(items)
+        if notify:
+            self.signals.logos_ready.emit(self.search_id, self)
 
-    def stop(self):
-        self._stop = True
+    def take(self) -> list:
+        with self._lock:
+            items, self._items = self._items, []
+        return items
+
+
+class LogoTask(QRunnable):
+    def __init__(self, base: str, names: list, batch: LogoBatch, cancelled: threading.Event):
+        super().__init__()
+        self.base = base
+        self.names = names
+        self.batch = batch
+        # Shared by every task of one search; setting it silences the lot
+        self.cancelled = cancelled
+        self.setAutoDelete(True)
 
     def run(self):
-        with ThreadPoolExecutor(max_workers=6) as pool:
-            futures = {pool.submit(fetch_logo, n): n for n in self.names}
-            for future in as_completed(futures):
-                if self._stop:
-                    break
-                name = futures[future]
-                try:
-                    px = future.result()
-                    if px and not px.isNull():
-                        self.logo_ready.emit(self.search_id, name, px)
-                except Exception:
-                    pass
+        if self.cancelled.is_set():
+            return
+        try:
+            px = fetch_logo(self.base)
+        except Exception:
+            return
+        if self.cancelled.is_set() or not px or px.isNull():
+            return
+        # Packages sharing a logo base are fetched once and fanned out
+        self.batch.add([(name, px) for name in self.names])
+
+
+def start_logo_tasks(names: list, search_id: int, signals: WorkerSignals) -> threading.Event:
+    """Queue one LogoTask per logo base and return the event that cancels them."""
+    groups: dict = {}
+    for n in names:
+        groups.setdefault(logo_base(n), []).append(n)
+    batch = LogoBatch(search_id, signals)
+    cancelled = threading.Event()
+    for base, group in groups.items():
+        _LOGO_THREADS.start(LogoTask(base, group, batch, cancelled))
+    return cancelled
 
 
 # ══════════════════════════════════════════════════════
 #  HELPERS — check if a package is installed locally
 # ══════════════════════════════════════════════════════
 
-def is_installed(pkg_name: str) -> bool:
-    """Returns True if pacman knows about this package being installed."""
+# (timestamp, names) from the last lookup — a whole result page shares one read
+_installed_cache: "tuple[float, frozenset] | None" = None
+_INSTALLED_TTL = 2.0
+
+# pacman keeps one "pkgname-pkgver-pkgrel" directory per installed package here
+_PACMAN_LOCAL = "/var/lib/pacman/local"
+
+
+def _local_db_names() -> frozenset:
+    # One readdir instead of forking pacman, and it works while another install holds the db lock
+    with os.scandir(_PACMAN_LOCAL) as entries:
+        return frozenset(e.name.rsplit("-", 2)[0] for e in entries if e.is_dir())
+
+
+def _pacman_names() -> frozenset:
     try:
         result = subprocess.run(
-            ["pacman", "-Q", pkg_name],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
+            ["pacman", "-Qq"],
+            capture_output=True,
+            text=True
         )
-        return result.returncode == 0
+        return frozenset(result.stdout.split()) if result.returncode == 0 else frozenset()
     except Exception:
-        return False
+        return frozenset()
+
+
+def installed_set() -> frozenset:
+    """Names of every locally installed package, refreshed at most every couple of seconds."""
+    global _installed_cache
+    now = time.monotonic()
+    if _installed_cache and now - _installed_cache[0] < _INSTALLED_TTL:
+        return _installed_cache[1]
+    try:
+        names = _local_db_names()
+    except OSError:
+        names = _pacman_names()
+    _installed_cache = (now, names)
+    return names
+
+
+def invalidate_installed():
+    """Forget the cached package list, e.g. after an install or uninstall."""
+    global _installed_cache
+    _installed_cache = None
 
 
 # ══════════════════════════════════════════════════════
@@ -212,31 +645,100 @@ def set_sudo_password(pw: str):
     global _SUDO_PASSWORD
     _SUDO_PASSWORD = pw
 
-def run_sudo(cmd: list, output_cb) -> bool:
-    """Run a command with sudo -S, feeding the cached password via stdin."""
-    full_cmd = ["sudo", "-S", "-k"] + cmd
-    output_cb(f"▶  Running:  sudo {' '.join(cmd)}\n")
-    try:
-        proc = subprocess.Popen(
-            full_cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1
-        )
+def stream_process(cmd: list, output_cb, env=None, should_stop=None, password=None) -> bool:
+    """Run cmd, passing each output line to output_cb; password, if given, goes on stdin.
+
+    The pipe is read non-blockingly through a selector, so should_stop() is
+    polled at least every 100 ms even while the process is silent.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL if password is None else subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        env=env
+    )
+    if password is not None:
         # Feed password once on first line (sudo -S reads from stdin)
-        proc.stdin.write(_SUDO_PASSWORD + "\n")
-        proc.stdin.flush()
+        try:
+            proc.stdin.write((password + "\n").encode())
+            proc.stdin.flush()
+        except BrokenPipeError:
+            pass
         proc.stdin.close()
-        for line in proc.stdout:
-            stripped = line.rstrip()
-            # Hide the "password:" prompt line sudo echoes back
-            if stripped.lower().startswith("[sudo]") or stripped.endswith("password:"):
+
+    def emit(raw: bytes):
+        stripped = raw.decode("utf-8", "replace").rstrip()
+        # Hide the "password:" prompt line sudo echoes back
+        if stripped.lower().startswith("[sudo]") or stripped.endswith("password:"):
+            return
+        output_cb(stripped)
+
+    fd = proc.stdout.fileno()
+    os.set_blocking(fd, False)
+    tail = b""
+    with selectors.DefaultSelector() as sel:
+        sel.register(fd, selectors.EVENT_READ)
+        while True:
+            if should_stop and should_stop():
+                proc.terminate()
+                break
+            if not sel.select(timeout=0.1):
                 continue
-            output_cb(stripped)
-        proc.wait()
-        return proc.returncode == 0
+            try:
+                chunk = os.read(fd, 4096)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                break
+            # Only whole lines go out; keep the unfinished remainder for the next read
+            *lines, tail = (tail + chunk).split(b"\n")
+            for line in lines:
+                emit(line)
+    if tail:
+        emit(tail)
+    proc.stdout.close()
+    proc.wait()
+    return proc.returncode == 0
+
+
+def _sudo_cached() -> bool:
+    """True if sudo's timestamp is still valid, so it won't ask for a password."""
+    try:
+        return subprocess.run(
+            ["sudo", "-n", "true"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=5
+        ).returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+
+def run_sudo(cmd: list, output_cb, should_stop=None) -> bool:
+    """Run a command with sudo, feeding the cached password via stdin only if it is asked for."""
+    output_cb(f"▶  Running:  sudo {' '.join(cmd)}\n")
+    try:
+        # No -k: the keepalive keeps sudo's timestamp fresh, so most calls skip the
+        # password / PAM round entirely. When it does, the password stays off the
+        # stdin that the root command inherits — if sudo won't read it, nobody should.
+        if _sudo_cached():
+            asked = []
+
+            def watch(line: str):
+                # The timestamp ran out between the probe and this call: sudo refused
+                # before running anything, so the command is safe to retry with -S
+                if line == "sudo: a password is required":
+                    asked.append(line)
+                else:
+                    output_cb(line)
+
+            ok = stream_process(["sudo", "-n"] + cmd, watch, should_stop=should_stop)
+            if ok or not asked:
+                return ok
+        return stream_process(["sudo", "-S"] + cmd, output_cb, should_stop=should_stop,
+                              password=_SUDO_PASSWORD)
     except Exception as e:
         output_cb(f"❌  Error: {e}")
         return False
@@ -246,12 +748,25 @@ class PkgWorker(QThread):
     output_line = pyqtSignal(str)
     finished_ok = pyqtSignal(bool)
 
+    # Every worker created so far, for the keepalive to see if one still needs sudo
+    live = weakref.WeakSet()
+
     def __init__(self, pkg_name: str, is_aur: bool, uninstall: bool = False):
         super().__init__()
+        PkgWorker.live.add(self)
         self.pkg_name  = pkg_name
         self.is_aur    = is_aur
         self.uninstall = uninstall
 
+    @classmethod
+    def stop_all(cls, timeout_ms: int = 5000):
+        """Interrupt every job still running and wait for its process to be terminated."""
+        running = [w for w in cls.live if w.isRunning()]
+        for worker in running:
+            worker.requestInterruption()
+        for worker in running:
+            worker.wait(timeout_ms)
+
     def run(self):
         if self.uninstall:
             if not shutil.which("pacman"):
@@ -260,7 +775,8 @@ class PkgWorker(QThread):
                 return
             success = run_sudo(
                 ["pacman", "-Rns", "--noconfirm", self.pkg_name],
-                self.output_line.emit
+                self.output_line.emit,
+                should_stop=self.isInterruptionRequested
             )
             self.output_line.emit(
                 "\n✅  Uninstalled successfully!" if success else "\n❌  Uninstall failed"
@@ -276,25 +792,13 @@ class PkgWorker(QThread):
                 # AUR helpers handle their own privilege escalation via sudo internally
                 self.output_line.emit(f"▶  Running:  {installer} -S --noconfirm {self.pkg_name}\n")
                 try:
-                    proc = subprocess.Popen(
+                    success = stream_process(
                         [installer, "-S", "--noconfirm", self.pkg_name],
-                        stdin=subprocess.PIPE,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        text=True,
-                        bufsize=1,
-                        env={**os.environ, "SUDO_ASKPASS": "/bin/true"}
+                        self.output_line.emit,
+                        env={**os.environ, "SUDO_ASKPASS": "/bin/true"},
+                        should_stop=self.isInterruptionRequested,
+                        password=_SUDO_PASSWORD
                     )
-                    proc.stdin.write(_SUDO_PASSWORD + "\n")
-                    proc.stdin.flush()
-                    proc.stdin.close()
-                    for line in proc.stdout:
-                        stripped = line.rstrip()
-                        if stripped.lower().startswith("[sudo]") or stripped.endswith("password:"):
-                            continue
-                        self.output_line.emit(stripped)
-                    proc.wait()
-                    success = proc.returncode == 0
                 except Exception as e:
                     self.output_line.emit(f"❌  Error: {e}")
                     success = False
@@ -305,7 +809,8 @@ class PkgWorker(QThread):
                     return
                 success = run_sudo(
                     ["pacman", "-S", "--noconfirm", self.pkg_name],
-                    self.output_line.emit
+                    self.output_line.emit,
+                    should_stop=self.isInterruptionRequested
                 )
             self.output_line.emit(
                 "\n✅  Installation complete!" if success else "\n❌  Installation failed"
@@ -313,6 +818,173 @@ class PkgWorker(QThread):
             self.finished_ok.emit(success)
 
 
+# ══════════════════════════════════════════════════════
+#  STYLESHEETS — one sheet per window, with object-name selectors for its
+#  children, so Qt parses each once instead of once per widget
+# ══════════════════════════════════════════════════════
+
+PKG_DIALOG_QSS = """
+    QDialog { background:#0A0B18; border:1px solid #1E2040; }
+    QLabel#PkgTitle {
+        font-size:15px; color:#DDE2FF; font-family:'JetBrains Mono',monospace;
+    }
+    QTextEdit#Terminal {
+        background:#060710;
+        color:#7BF1A8;
+        font-family:'JetBrains Mono','Fira Code',monospace;
+        font-size:12px;
+        border:1px solid #1A1E40;
+        border-radius:8px;
+        padding:10px;
+    }
+    QDialog[uninstall="true"] QTextEdit#Terminal { color:#F4A261; }
+    QLabel#PkgStatus {
+        color:#445577; font-size:11px; font-family:'JetBrains Mono',monospace;
+    }
+    QLabel#PkgStatus[state="ok"]     { color:#44CC88; }
+    QLabel#PkgStatus[state="failed"] { color:#CC4444; }
+    QPushButton#Close {
+        background:#1A1E40; color:#445577;
+        border:1px solid #2A2E50; border-radius:8px;
+        padding:0 20px; font-size:12px;
+    }
+    QPushButton#Close:enabled {
+        background:#4CC9F0; color:#0A0B18;
+        border:none; font-weight:bold;
+    }
+    QPushButton#Close:enabled:hover { background:#5DD8FA; }
+"""
+
+SEARCH_BTN_QSS = """
+    QPushButton {
+        background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
+            stop:0 #4361EE, stop:1 #4CC9F0);
+        color:white; font-size:13px; font-weight:bold;
+        font-family:'JetBrains Mono',monospace;
+        border-radius:12px; border:none;
+    }
+    QPushButton:hover {
+        background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
+            stop:0 #5572FF, stop:1 #5DD8FA);
+    }
+    QPushButton:pressed { background:#2D3FBB; }
+    QPushButton[loading="true"] {
+        background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
+            stop:0 #4CC9F0, stop:1 #7BF1A8);
+        color:#0A0B18;
+    }
+"""
+
+WINDOW_QSS = """
+    QWidget     { background-color:#0A0B18; color:#DDE2FF; }
+    QListView   { border:none; background:transparent; }
+    QScrollBar:vertical {
+        background:#10112A; width:5px; border-radius:2px; margin:0;
+    }
+    QScrollBar::handle:vertical {
+        background:#2A2D5A; border-radius:2px; min-height:24px;
+    }
+    QScrollBar::handle:vertical:hover { background:#4CC9F0; }
+    QScrollBar::add-line:vertical,
+    QScrollBar::sub-line:vertical { height:0; }
+
+    QLabel#Brand {
+        font-family:'JetBrains Mono',monospace;
+        font-size:25px; font-weight:bold;
+        color:#4CC9F0; letter-spacing:3px;
+    }
+    QLabel#Tagline {
+        font-size:12px; color:#2A3A5A; margin-left:10px;
+        font-family:'Segoe UI','Ubuntu',sans-serif;
+    }
+    QLabel#DbPill {
+        font-size:11px; font-family:'JetBrains Mono',monospace;
+        color:#CC4444; background:#2A0D0D; border:1px solid #AA333333;
+        border-radius:8px; padding:4px 10px;
+    }
+    QLabel#DbPill[ok="true"] {
+        color:#44CC88; background:#0D2A20; border:1px solid #33AA6633;
+    }
+    QFrame#SF {
+        background:#10112A; border-radius:14px;
+        border:1px solid #1E2040;
+    }
+    QLabel#SearchIcon { font-size:20px; color:#2A3A5A; }
+    QLineEdit#SearchInput {
+        background:transparent; border:none;
+        font-size:15px; font-family:'Segoe UI','Ubuntu',sans-serif;
+        color:#DDE2FF; padding:0;
+    }
+    QLabel#TryLbl {
+        color:#2A3A5A; font-size:11px; font-family:'JetBrains Mono',monospace;
+    }
+    QPushButton[class="chip"] {
+        background:#10112A; color:#3A4A7A;
+        border:1px solid #1A1E40; border-radius:12px;
+        padding:0 11px; font-size:11px;
+        font-family:'JetBrains Mono',monospace;
+    }
+    QPushButton[class="chip"]:hover {
+        color:#4CC9F0; border-color:#4CC9F044; background:#14163A;
+    }
+    QLabel#Status {
+        color:#1E2A4A; font-size:11px; font-family:'JetBrains Mono',monospace;
+    }
+    QLabel#Empty {
+        color:#2A3A5A; font-size:15px;
+        font-family:'JetBrains Mono',monospace; padding:60px;
+    }
+    QLabel#Footer {
+        color:#141828; font-size:10px; font-family:'JetBrains Mono',monospace;
+    }
+"""
+
+PASSWORD_DIALOG_QSS = """
+    QDialog { background:#0A0B18; border:1px solid #1E2040; border-radius:16px; }
+    QLabel#PwTitle {
+        font-family:'JetBrains Mono',monospace; font-size:17px;
+        font-weight:bold; color:#DDE2FF;
+    }
+    QLabel#PwSubtitle {
+        font-size:12px; color:#445577;
+        font-family:'Segoe UI','Ubuntu',sans-serif;
+    }
+    QLineEdit#Password {
+        background:#10112A; color:#DDE2FF;
+        border:1px solid #2A2E50; border-radius:10px;
+        font-size:14px; padding:0 14px;
+        font-family:'Segoe UI','Ubuntu',sans-serif;
+    }
+    QLineEdit#Password:focus { border-color:#4CC9F0; }
+    QLabel#PwError {
+        color:#CC4444; font-size:11px; font-family:'JetBrains Mono',monospace;
+    }
+    QPushButton#Skip {
+        background:transparent; color:#334466;
+        border:1px solid #1E2040; border-radius:9px;
+        font-size:11px; padding:0 14px;
+    }
+    QPushButton#Skip:hover { color:#4CC9F0; border-color:#4CC9F033; }
+    QPushButton#Unlock {
+        background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
+            stop:0 #4361EE, stop:1 #4CC9F0);
+        color:white; font-weight:bold; font-size:13px;
+        font-family:'JetBrains Mono',monospace;
+        border-radius:9px; border:none; padding:0 20px;
+    }
+    QPushButton#Unlock:hover {
+        background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
+            stop:0 #5572FF, stop:1 #5DD8FA);
+    }
+"""
+
+
+def repolish(widget: QWidget):
+    """Re-apply the stylesheet after a property its selectors match on has changed."""
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
 # ══════════════════════════════════════════════════════
 #  PKG DIALOG — live terminal for install OR uninstall
 # ══════════════════════════════════════════════════════
@@ -330,9 +1002,8 @@ class PkgDialog(QDialog):
         terminal_color = "#F4A261" if uninstall else "#7BF1A8"
         title_icon     = "🗑" if uninstall else "⬇"
 
-        self.setStyleSheet("""
-            QDialog { background:#0A0B18; border:1px solid #1E2040; }
-        """)
+        self.setProperty("uninstall", uninstall)
+        self.setStyleSheet(PKG_DIALOG_QSS)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 16)
@@ -344,9 +1015,7 @@ class PkgDialog(QDialog):
             f"{title_icon}  {action_word}  "
             f"<b style='color:{terminal_color}'>{pkg_name}</b>"
         )
-        title_lbl.setStyleSheet(
-            "font-size:15px; color:#DDE2FF; font-family:'JetBrains Mono',monospace;"
-        )
+        title_lbl.setObjectName("PkgTitle")
         title_row.addWidget(title_lbl)
         title_row.addStretch()
         layout.addLayout(title_row)
@@ -354,42 +1023,29 @@ class PkgDialog(QDialog):
         # Terminal box
         self.terminal = QTextEdit()
         self.terminal.setReadOnly(True)
-        self.terminal.setStyleSheet(f"""
-            QTextEdit {{
-                background:#060710;
-                color:{terminal_color};
-                font-family:'JetBrains Mono','Fira Code',monospace;
-                font-size:12px;
-                border:1px solid #1A1E40;
-                border-radius:8px;
-                padding:10px;
-            }}
-        """)
+        self.terminal.setObjectName("Terminal")
+        # Keep very chatty installs from growing the document without bound
+        self.terminal.document().setMaximumBlockCount(5000)
         layout.addWidget(self.terminal)
 
+        # pacman/yay can print hundreds of lines a second — collect them and
+        # insert in one go every 30 ms instead of re-laying out per line
+        self._pending: list = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(30)
+        self._flush_timer.timeout.connect(self._flush)
+
         # Bottom row
         bottom = QHBoxLayout()
         waiting_text = "Uninstalling…" if uninstall else "Installing…"
         self.status_lbl = QLabel(waiting_text)
-        self.status_lbl.setStyleSheet(
-            "color:#445577; font-size:11px; font-family:'JetBrains Mono',monospace;"
-        )
+        self.status_lbl.setObjectName("PkgStatus")
         self.close_btn = QPushButton("Close")
         self.close_btn.setEnabled(False)
         self.close_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.close_btn.setFixedHeight(32)
-        self.close_btn.setStyleSheet("""
-            QPushButton {
-                background:#1A1E40; color:#445577;
-                border:1px solid #2A2E50; border-radius:8px;
-                padding:0 20px; font-size:12px;
-            }
-            QPushButton:enabled {
-                background:#4CC9F0; color:#0A0B18;
-                border:none; font-weight:bold;
-            }
-            QPushButton:enabled:hover { background:#5DD8FA; }
-        """)
+        self.close_btn.setObjectName("Close")
         self.close_btn.clicked.connect(self.accept)
         bottom.addWidget(self.status_lbl)
         bottom.addStretch()
@@ -398,21 +1054,42 @@ class PkgDialog(QDialog):
 
         # Start worker
         self.worker = PkgWorker(pkg_name, is_aur, uninstall)
-        self.worker.output_line.connect(self._append)
-        self.worker.finished_ok.connect(self._done)
+        # Emitted from the worker's thread — queue them onto ours explicitly
+        self.worker.output_line.connect(self._append, Qt.ConnectionType.QueuedConnection)
+        self.worker.finished_ok.connect(self._done, Qt.ConnectionType.QueuedConnection)
         self.worker.start()
 
     def _append(self, line: str):
-        self.terminal.append(line)
+        self._pending.append(line)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        text = "\n".join(self._pending)
+        self._pending.clear()
+        if not self.terminal.document().isEmpty():
+            text = "\n" + text
+        cursor = self.terminal.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
         sb = self.terminal.verticalScrollBar()
         sb.setValue(sb.maximum())
 
+    def reject(self):
+        # Esc or the title-bar close abandons the job — stop its process rather
+        # than leave it running with nobody watching
+        if self.worker.isRunning():
+            self.worker.requestInterruption()
+        super().reject()
+
     def _done(self, success: bool):
+        self._flush_timer.stop()
+        self._flush()
         self.status_lbl.setText("Done ✓" if success else "Failed ✗")
-        self.status_lbl.setStyleSheet(
-            f"color:{'#44CC88' if success else '#CC4444'};"
-            "font-size:11px; font-family:'JetBrains Mono',monospace;"
-        )
+        self.status_lbl.setProperty("state", "ok" if success else "failed")
+        repolish(self.status_lbl)
         self.close_btn.setEnabled(True)
 
 
@@ -435,237 +1112,280 @@ def repo_color(repo: str) -> str:
 
 
 # ══════════════════════════════════════════════════════
-#  APP CARD
+#  RESULTS LIST — one model row per package, painted as a card by a delegate
+#  so only the rows on screen are ever drawn (no widgets per result)
 # ══════════════════════════════════════════════════════
 
-class AppCard(QFrame):
-    def __init__(self, name: str, repo: str, desc: str,
-                 source: str = "online", parent_window=None):
-        super().__init__()
-        self.pkg_name = name
-        self.repo = repo
-        self.parent_window = parent_window
-        self.setObjectName("AppCard")
-        accent = repo_color(repo)
-
-        # Check installed state upfront (fast pacman -Q call)
-        self._installed = is_installed(name)
-
-        self.setStyleSheet(f"""
-            QFrame#AppCard {{
-                background: qlineargradient(x1:0,y1:0,x2:1,y2:1,
-                    stop:0 #111228, stop:1 #161730);
-                border-radius: 16px;
-                border: 1px solid #1E2040;
-            }}
-            QFrame#AppCard:hover {{
-                background: qlineargradient(x1:0,y1:0,x2:1,y2:1,
-                    stop:0 #171A38, stop:1 #1C1E38);
-                border: 1px solid {accent}60;
-            }}
-        """)
-
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setOffset(0, 4)
-        shadow.setColor(QColor(0, 0, 0, 100))
-        self.setGraphicsEffect(shadow)
-
-        root = QHBoxLayout(self)
-        root.setContentsMargins(14, 12, 18, 12)
-        root.setSpacing(14)
+CARD_ROW_H   = 124   # card + the gap below it
+CARD_GAP     = 10
+CARD_RADIUS  = 16
+BTN_H        = 28
+MONO         = "JetBrains Mono"
+SANS         = "Segoe UI"
+
+
+def install_cmd(pkg: dict) -> str:
+    name = pkg["name"]
+    return f"yay -S {name}" if pkg["repo"].upper() == "AUR" else f"sudo pacman -S {name}"
+
+
+def name_key(name: str) -> str:
+    # Interned, so every row key and every key looked up for that row is one shared
+    # string object, and the model's dict hits compare by identity
+    return sys.intern(name if name.islower() else name.lower())
+
+
+def _alpha(color: QColor, alpha: int) -> QColor:
+    c = QColor(color)
+    c.setAlpha(alpha)
+    return c
+
+
+def _font(family: str, px: int, bold: bool = False) -> QFont:
+    f = QFont(family)
+    f.setPixelSize(px)
+    f.setBold(bold)
+    return f
+
+
+class ResultsModel(QAbstractListModel):
+    """Search results as plain dicts, plus the per-row UI state the delegate paints."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pkgs: list = []
+        self._rows: dict = {}   # name_key(name) -> row
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._pkgs)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if index.isValid() and role == Qt.ItemDataRole.DisplayRole:
+            return self._pkgs[index.row()]["name"]
+        return None
+
+    def pkg(self, index) -> dict:
+        return self._pkgs[index.row()]
+
+    def find(self, name: str) -> "dict | None":
+        row = self._rows.get(name_key(name))
+        return None if row is None else self._pkgs[row]
+
+    def clear(self):
+        self.beginResetModel()
+        self._pkgs = []
+        self._rows = {}
+        self.endResetModel()
+
+    def set_packages(self, results: list):
+        # Check installed state upfront (one cached local-db read per search)
+        installed = installed_set()
+        self.beginResetModel()
+        self._pkgs = [
+            dict(pkg, installed=pkg["name"] in installed, busy=None, copied=False, logo=None)
+            for pkg in results
+        ]
+        self._rows = {name_key(pkg["name"]): row for row, pkg in enumerate(self._pkgs)}
+        self.endResetModel()
+
+    def update(self, name: str, **changes):
+        """Change one row's state by package name; a no-op once a new search replaced it."""
+        row = self._rows.get(name_key(name))
+        if row is None:
+            return
+        self._pkgs[row].update(changes)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+
+class CardDelegate(QStyledItemDelegate):
+    """Paints a result row as a card and turns clicks on its buttons into signals."""
+    copy_clicked   = pyqtSignal(str)   # pkg_name
+    action_clicked = pyqtSignal(str)   # pkg_name
+
+    def __init__(self, view):
+        super().__init__(view)
+        self._view = view
+        self._hover = None   # (row, "copy" | "action") under the mouse
+        self.name_font  = _font(MONO, 15, bold=True)
+        self.badge_font = _font(MONO, 10, bold=True)
+        self.small_font = _font(MONO, 10)
+        self.desc_font  = _font(SANS, 12)
+        self.btn_font   = _font(MONO, 11, bold=True)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), CARD_ROW_H)
+
+    # ── geometry ─────────────────────────────────────────
+
+    def _layout(self, rect: QRect, pkg: dict) -> dict:
+        card = rect.adjusted(0, 0, -6, -CARD_GAP)
+        icon = QRect(card.left() + 31, card.center().y() - 24, 48, 48)
+        left = icon.right() + 15
+        right = card.right() - 18
+
+        action_w = QFontMetrics(self.btn_font).horizontalAdvance(self._action_text(pkg)) + 28
+        action = QRect(right - action_w + 1, card.bottom() - 12 - BTN_H + 1, action_w, BTN_H)
+        copy_w = QFontMetrics(self.small_font).horizontalAdvance(f"  $ {install_cmd(pkg)}") + 24
+        copy = QRect(action.left() - 8 - copy_w, action.top(), copy_w, BTN_H)
+
+        return {
+            "card":   card,
+            "strip":  QRect(card.left() + 14, card.center().y() - 26, 3, 52),
+            "icon":   icon,
+            "title":  QRect(left, card.top() + 12, right - left, 20),
+            "desc":   QRect(left, card.top() + 36, right - left, 34),
+            "copy":   copy,
+            "action": action,
+        }
+
+    def _action_text(self, pkg: dict) -> str:
+        return pkg["busy"] or ("🗑  Uninstall" if pkg["installed"] else "⬇  Install")
+
+    def _hit(self, rect: QRect, pkg: dict, pos) -> "str | None":
+        rects = self._layout(rect, pkg)
+        for part in ("copy", "action"):
+            if rects[part].contains(pos):
+                return part
+        return None
+
+    # ── painting ─────────────────────────────────────────
+
+    def paint(self, p, option, index):
+        pkg = index.model().pkg(index)
+        r = self._layout(option.rect, pkg)
+        accent = QColor(repo_color(pkg["repo"]))
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        hover_part = self._hover[1] if hovered and self._hover and self._hover[0] == index.row() else None
+
+        p.save()
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+
+        # Card body with a dark lip along the bottom for depth
+        card = QRectF(r["card"]).adjusted(0.5, 0.5, -0.5, -0.5)
+        p.setPen(Qt.PenStyle.NoPen)
+        p.setBrush(QColor("#07081A"))
+        p.drawRoundedRect(card, CARD_RADIUS, CARD_RADIUS)
+        grad = QLinearGradient(card.topLeft(), card.bottomRight())
+        grad.setColorAt(0, QColor("#171A38" if hovered else "#111228"))
+        grad.setColorAt(1, QColor("#1C1E38" if hovered else "#161730"))
+        p.setBrush(QBrush(grad))
+        p.setPen(QPen(_alpha(accent, 0x60) if hovered else QColor("#1E2040"), 1))
+        p.drawRoundedRect(card.adjusted(0, 0, 0, -2.5), CARD_RADIUS, CARD_RADIUS)
 
         # Colour strip
-        strip = QFrame()
-        strip.setFixedWidth(3)
-        strip.setFixedHeight(52)
-        strip.setStyleSheet(f"""
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,
-                stop:0 {accent}, stop:1 {accent}33);
-            border-radius:2px;
-        """)
-        root.addWidget(strip, 0, Qt.AlignmentFlag.AlignVCenter)
-
-        # Icon — placeholder shown immediately
-        self.icon_lbl = QLabel()
-        self.icon_lbl.setFixedSize(48, 48)
-        self.icon_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.icon_lbl.setStyleSheet("background:transparent;")
-        self.icon_lbl.setPixmap(placeholder_pixmap(name, accent, 48))
-        root.addWidget(self.icon_lbl, 0, Qt.AlignmentFlag.AlignVCenter)
-
-        # Text column
-        col = QVBoxLayout()
-        col.setSpacing(4)
-        col.setContentsMargins(0, 0, 0, 0)
+        strip = QLinearGradient(QPointF(r["strip"].topLeft()), QPointF(r["strip"].bottomLeft()))
+        strip.setColorAt(0, accent)
+        strip.setColorAt(1, _alpha(accent, 0x33))
+        p.setPen(Qt.PenStyle.NoPen)
+        p.setBrush(QBrush(strip))
+        p.drawRoundedRect(QRectF(r["strip"]), 2, 2)
+
+        # Icon — placeholder until the logo arrives
+        logo = pkg["logo"] or placeholder_pixmap(pkg["name"], accent.name(), 48)
+        p.drawPixmap(r["icon"], logo)
 
         # Title + badges
-        title_row = QHBoxLayout()
-        title_row.setSpacing(8)
-
-        name_lbl = QLabel(name)
-        name_lbl.setStyleSheet("""
-            font-family:'JetBrains Mono','Fira Code',monospace;
-            font-size:15px; font-weight:bold; color:#DDE2FF;
-        """)
-
-        repo_badge = QLabel(f" {repo.upper()} ")
-        repo_badge.setFixedHeight(20)
-        repo_badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        repo_badge.setStyleSheet(f"""
-            background:{accent}20; color:{accent};
-            border:1px solid {accent}50; border-radius:10px;
-            padding:0 8px; font-size:10px; font-weight:bold;
-            font-family:'JetBrains Mono',monospace;
-        """)
-
-        if source == "online":
-            src_badge = QLabel(" 🌐 LIVE ")
-            src_badge.setStyleSheet(
-                "background:#0D2A20; color:#44CC88; border:1px solid #33AA6644;"
-                "border-radius:10px; padding:0 6px; font-size:10px;"
-                "font-family:'JetBrains Mono',monospace;"
-            )
+        title = r["title"]
+        p.setFont(self.name_font)
+        p.setPen(QColor("#DDE2FF"))
+        name, name_w = pkg["name"], p.fontMetrics().horizontalAdvance(pkg["name"])
+        if name_w > title.width() // 2:
+            name_w = title.width() // 2
+            name = p.fontMetrics().elidedText(name, Qt.TextElideMode.ElideRight, name_w)
+        p.drawText(QRect(title.left(), title.top(), name_w + 2, title.height()),
+                   Qt.AlignmentFlag.AlignVCenter, name)
+        x = title.left() + name_w + 8
+        x = self._badge(p, x, title.top(), f" {pkg['repo'].upper()} ", self.badge_font,
+                        accent, _alpha(accent, 0x20), _alpha(accent, 0x50)) + 8
+        if pkg.get("source", "online") == "online":
+            self._badge(p, x, title.top(), " 🌐 LIVE ", self.small_font,
+                        QColor("#44CC88"), QColor("#0D2A20"), QColor(0x33, 0xAA, 0x66, 0x44))
         else:
-            src_badge = QLabel(" 📖 WIKI ")
-            src_badge.setStyleSheet(
-                "background:#2A2050; color:#8877CC; border:1px solid #4433AA44;"
-                "border-radius:10px; padding:0 6px; font-size:10px;"
-                "font-family:'JetBrains Mono',monospace;"
-            )
-        src_badge.setFixedHeight(20)
-
-        title_row.addWidget(name_lbl)
-        title_row.addWidget(repo_badge)
-        title_row.addWidget(src_badge)
-        title_row.addStretch()
+            self._badge(p, x, title.top(), " 📖 WIKI ", self.small_font,
+                        QColor("#8877CC"), QColor("#2A2050"), QColor(0x44, 0x33, 0xAA, 0x44))
 
         # Description
-        desc_lbl = QLabel(desc[:150] + ("…" if len(desc) > 150 else ""))
-        desc_lbl.setWordWrap(True)
-        desc_lbl.setStyleSheet(
-            "font-size:12px; color:#4A5A80;"
-            "font-family:'Segoe UI','Ubuntu',sans-serif;"
-        )
-
-        # Buttons
-        btn_row = QHBoxLayout()
-        btn_row.setSpacing(8)
-        btn_row.addStretch()
+        desc = pkg["desc"]
+        p.setFont(self.desc_font)
+        p.setPen(QColor("#4A5A80"))
+        p.drawText(r["desc"], Qt.TextFlag.TextWordWrap,
+                   desc[:150] + ("…" if len(desc) > 150 else ""))
 
         # Copy command button
-        cmd = f"yay -S {name}" if repo.upper() == "AUR" else f"sudo pacman -S {name}"
-        self._cmd = cmd
-        self.copy_btn = QPushButton(f"  $ {cmd}")
-        self.copy_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.copy_btn.setFixedHeight(28)
-        self.copy_btn.setStyleSheet(f"""
-            QPushButton {{
-                background:#0E0F22; color:{accent};
-                font-size:10px; font-family:'JetBrains Mono',monospace;
-                border-radius:7px; padding:0 12px;
-                border:1px solid {accent}30; text-align:left;
-            }}
-            QPushButton:hover {{ background:{accent}18; border-color:{accent}70; }}
-        """)
-        self.copy_btn.clicked.connect(self._copy)
+        copy = QRectF(r["copy"])
+        p.setPen(QPen(_alpha(accent, 0x70 if hover_part == "copy" else 0x30), 1))
+        p.setBrush(_alpha(accent, 0x18) if hover_part == "copy" else QColor("#0E0F22"))
+        p.drawRoundedRect(copy.adjusted(0.5, 0.5, -0.5, -0.5), 7, 7)
+        p.setFont(self.small_font)
+        p.setPen(accent)
+        p.drawText(copy.adjusted(12, 0, 0, 0), Qt.AlignmentFlag.AlignVCenter,
+                   "  ✓ Copied!" if pkg["copied"] else f"  $ {install_cmd(pkg)}")
 
         # Install / Uninstall button — styled differently based on state
-        self.action_btn = QPushButton()
-        self.action_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.action_btn.setFixedHeight(28)
-        self._accent = accent
-        self._update_action_btn()
-        self.action_btn.clicked.connect(self._on_action)
-
-        btn_row.addWidget(self.copy_btn)
-        btn_row.addWidget(self.action_btn)
-
-        col.addLayout(title_row)
-        col.addWidget(desc_lbl)
-        col.addLayout(btn_row)
-        root.addLayout(col)
-
-    def _update_action_btn(self):
-        """Redraw the button label and style based on current installed state."""
-        accent = self._accent
-        if self._installed:
-            self.action_btn.setText("🗑  Uninstall")
-            self.action_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: transparent;
-                    color: #CC4444;
-                    font-weight: bold; font-size: 11px;
-                    font-family: 'JetBrains Mono', monospace;
-                    border-radius: 7px; padding: 0 14px;
-                    border: 1px solid #CC444466;
-                }}
-                QPushButton:hover {{
-                    background: #CC444422;
-                    border-color: #CC4444;
-                }}
-                QPushButton:pressed {{ background: #CC444444; }}
-                QPushButton:disabled {{
-                    background: #2A2E50; color: #445577; border: none;
-                }}
-            """)
-        else:
-            self.action_btn.setText("⬇  Install")
-            self.action_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: {accent}; color: #0A0B18;
-                    font-weight: bold; font-size: 11px;
-                    font-family: 'JetBrains Mono', monospace;
-                    border-radius: 7px; padding: 0 14px; border: none;
-                }}
-                QPushButton:hover {{ background: #FFFFFF; color: #0A0B18; }}
-                QPushButton:pressed {{ background: {accent}BB; }}
-                QPushButton:disabled {{
-                    background: #2A2E50; color: #445577; border: none;
-                }}
-            """)
-
-    def _copy(self):
-        QApplication.clipboard().setText(self._cmd)
-        self.copy_btn.setText("  ✓ Copied!")
-        QTimer.singleShot(1500, lambda: self.copy_btn.setText(f"  $ {self._cmd}"))
-
-    def _on_action(self):
-        if self._installed:
-            self._uninstall()
+        action = QRectF(r["action"])
+        p.setFont(self.btn_font)
+        if pkg["busy"]:
+            p.setPen(Qt.PenStyle.NoPen)
+            p.setBrush(QColor("#2A2E50"))
+            text_color = QColor("#445577")
+        elif pkg["installed"]:
+            red = QColor("#CC4444")
+            p.setPen(QPen(red if hover_part == "action" else _alpha(red, 0x66), 1))
+            p.setBrush(_alpha(red, 0x22) if hover_part == "action" else Qt.GlobalColor.transparent)
+            text_color = red
         else:
-            self._install()
-
-    def _install(self):
-        is_aur = self.repo.upper() == "AUR"
-        dlg = PkgDialog(self.pkg_name, is_aur, uninstall=False, parent=self.parent_window)
-        self.action_btn.setEnabled(False)
-        self.action_btn.setText("Installing…")
-        dlg.worker.finished_ok.connect(self._install_done)
-        dlg.show()
-
-    def _install_done(self, success: bool):
-        if success:
-            self._installed = True
-        self.action_btn.setEnabled(True)
-        self._update_action_btn()
-
-    def _uninstall(self):
-        is_aur = self.repo.upper() == "AUR"
-        dlg = PkgDialog(self.pkg_name, is_aur, uninstall=True, parent=self.parent_window)
-        self.action_btn.setEnabled(False)
-        self.action_btn.setText("Uninstalling…")
-        dlg.worker.finished_ok.connect(self._uninstall_done)
-        dlg.show()
-
-    def _uninstall_done(self, success: bool):
-        if success:
-            self._installed = False
-        self.action_btn.setEnabled(True)
-        self._update_action_btn()
-
-    def set_logo(self, px: QPixmap):
-        self.icon_lbl.setPixmap(rounded_pixmap(px, 48, 12))
+            p.setPen(Qt.PenStyle.NoPen)
+            p.setBrush(QColor("#FFFFFF") if hover_part == "action" else accent)
+            text_color = QColor("#0A0B18")
+        p.drawRoundedRect(action.adjusted(0.5, 0.5, -0.5, -0.5), 7, 7)
+        p.setPen(text_color)
+        p.drawText(action, Qt.AlignmentFlag.AlignCenter, self._action_text(pkg))
+
+        p.restore()
+
+    def _badge(self, p, x: int, y: int, text: str, font: QFont,
+               fg: QColor, bg: QColor, border: QColor) -> int:
+        """Draw a pill badge with its left edge at x; return its right edge."""
+        p.setFont(font)
+        rect = QRectF(x, y, p.fontMetrics().horizontalAdvance(text) + 16, 20)
+        p.setPen(QPen(border, 1))
+        p.setBrush(bg)
+        p.drawRoundedRect(rect.adjusted(0.5, 0.5, -0.5, -0.5), 10, 10)
+        p.setPen(fg)
+        p.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+        return int(rect.right())
+
+    # ── interaction ──────────────────────────────────────
+
+    def editorEvent(self, event, model, option, index):
+        kind = event.type()
+        if kind not in (QEvent.Type.MouseMove, QEvent.Type.MouseButtonRelease):
+            return False
+
+        pkg = model.pkg(index)
+        part = self._hit(option.rect, pkg, event.position().toPoint())
+
+        if kind == QEvent.Type.MouseMove:
+            hover = (index.row(), part) if part else None
+            if hover != self._hover:
+                self._hover = hover
+                viewport = self._view.viewport()
+                if part:
+                    viewport.setCursor(Qt.CursorShape.PointingHandCursor)
+                else:
+                    viewport.unsetCursor()
+                viewport.update(option.rect)
+            return False
+
+        if event.button() != Qt.MouseButton.LeftButton or not part:
+            return False
+        if part == "copy":
+            self.copy_clicked.emit(pkg["name"])
+        elif not pkg["busy"]:
+            self.action_clicked.emit(pkg["name"])
+        return True
 
 
 # ══════════════════════════════════════════════════════
@@ -678,42 +1398,16 @@ class SearchButton(QPushButton):
         self.setFixedHeight(50)
         self.setMinimumWidth(130)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._idle()
-
-    def _idle(self):
-        self.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
-                    stop:0 #4361EE, stop:1 #4CC9F0);
-                color:white; font-size:13px; font-weight:bold;
-                font-family:'JetBrains Mono',monospace;
-                border-radius:12px; border:none;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
-                    stop:0 #5572FF, stop:1 #5DD8FA);
-            }
-            QPushButton:pressed { background:#2D3FBB; }
-        """)
-
-    def _loading(self):
-        self.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
-                    stop:0 #4CC9F0, stop:1 #7BF1A8);
-                color:#0A0B18; font-size:13px; font-weight:bold;
-                font-family:'JetBrains Mono',monospace;
-                border-radius:12px; border:none;
-            }
-        """)
+        self.setProperty("loading", False)
+        self.setStyleSheet(SEARCH_BTN_QSS)
 
     def set_loading(self, val: bool):
+        self.setProperty("loading", val)
+        repolish(self)
         if val:
-            self._loading()
             self.setText("  ⏳  Searching…")
             self.setEnabled(False)
         else:
-            self._idle()
             self.setText("  🔍  Search")
             self.setEnabled(True)
 
@@ -728,28 +1422,26 @@ CHIPS = ["gimp", "kdenlive", "vlc", "libreoffice", "audacity", "inkscape", "obs"
 class AuraStore(QWidget):
     def __init__(self):
         super().__init__()
-        self.search_worker = None
-        self.logo_worker   = None
-        self._cards: dict  = {}
+        # Pooled threads for searches, leaving a couple of cores for the UI and logo fetches
+        self._pool = QThreadPool.globalInstance()
+        self._pool.setMaxThreadCount(max(2, QThread.idealThreadCount() - 2))
+        self._search_cancel = None   # threading.Event of the search in flight
+        self._search_worker = None   # ...its SearchWorker, so a queued one can be taken back
+        self._search_query  = None   # ...and the normalized query it is running
+        self._logo_cancel   = None   # threading.Event of the current logo batch
+        self._signals      = WorkerSignals(self)
+        # Always emitted from pool threads, so skip AutoConnection's per-emit thread check
+        self._signals.results_ready.connect(self._on_search_done, Qt.ConnectionType.QueuedConnection)
+        self._signals.logos_ready.connect(self._on_logos, Qt.ConnectionType.QueuedConnection)
         self._search_id    = 0   # increments every search — stale results get discarded
+        self._last_query   = None   # normalized query of the last dispatched search
+        QPixmapCache.setCacheLimit(20 * 1024)   # KB — rounded logos shown this session
 
         self.setWindowTitle("Aura Find — Open Source Alternatives")
         self.resize(980, 740)
         self.setMinimumSize(720, 540)
 
-        self.setStyleSheet("""
-            QWidget     { background-color:#0A0B18; color:#DDE2FF; }
-            QScrollArea { border:none; background:transparent; }
-            QScrollBar:vertical {
-                background:#10112A; width:5px; border-radius:2px; margin:0;
-            }
-            QScrollBar::handle:vertical {
-                background:#2A2D5A; border-radius:2px; min-height:24px;
-            }
-            QScrollBar::handle:vertical:hover { background:#4CC9F0; }
-            QScrollBar::add-line:vertical,
-            QScrollBar::sub-line:vertical { height:0; }
-        """)
+        self.setStyleSheet(WINDOW_QSS)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(36, 26, 36, 18)
@@ -758,28 +1450,16 @@ class AuraStore(QWidget):
         # ── HEADER ───────────────────────────────────────
         hdr = QHBoxLayout()
         brand = QLabel("◈  Aura Find")
-        brand.setStyleSheet("""
-            font-family:'JetBrains Mono',monospace;
-            font-size:25px; font-weight:bold;
-            color:#4CC9F0; letter-spacing:3px;
-        """)
+        brand.setObjectName("Brand")
         tagline = QLabel("discover free & open-source alternatives")
         tagline.setAlignment(Qt.AlignmentFlag.AlignBottom)
-        tagline.setStyleSheet(
-            "font-size:12px; color:#2A3A5A; margin-left:10px;"
-            "font-family:'Segoe UI','Ubuntu',sans-serif;"
-        )
+        tagline.setObjectName("Tagline")
 
         script_dir = os.path.dirname(os.path.realpath(__file__))
         db_ok = os.path.exists(os.path.join(script_dir, "data", "real_db.json"))
         db_pill = QLabel("  📖 Offline DB ✓  " if db_ok else "  📖 Offline DB ✗  ")
-        db_pill.setStyleSheet(
-            f"font-size:11px; font-family:'JetBrains Mono',monospace;"
-            f"color:{'#44CC88' if db_ok else '#CC4444'};"
-            f"background:{'#0D2A20' if db_ok else '#2A0D0D'};"
-            f"border:1px solid {'#33AA6633' if db_ok else '#AA333333'};"
-            f"border-radius:8px; padding:4px 10px;"
-        )
+        db_pill.setObjectName("DbPill")
+        db_pill.setProperty("ok", db_ok)
 
         hdr.addWidget(brand)
         hdr.addWidget(tagline, 0, Qt.AlignmentFlag.AlignBottom)
@@ -792,32 +1472,27 @@ class AuraStore(QWidget):
         search_frame = QFrame()
         search_frame.setObjectName("SF")
         search_frame.setFixedHeight(56)
-        search_frame.setStyleSheet("""
-            QFrame#SF {
-                background:#10112A; border-radius:14px;
-                border:1px solid #1E2040;
-            }
-        """)
         sf = QHBoxLayout(search_frame)
         sf.setContentsMargins(18, 0, 8, 0)
         sf.setSpacing(10)
 
         lbl_icon = QLabel("⌕")
-        lbl_icon.setStyleSheet("font-size:20px; color:#2A3A5A;")
+        lbl_icon.setObjectName("SearchIcon")
         sf.addWidget(lbl_icon)
 
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText(
             "Search any app…  e.g. photoshop, spotify, premiere, discord"
         )
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                background:transparent; border:none;
-                font-size:15px; font-family:'Segoe UI','Ubuntu',sans-serif;
-                color:#DDE2FF; padding:0;
-            }
-        """)
+        self.search_input.setObjectName("SearchInput")
+        # Every trigger (typing, Enter, chips, the button) goes through perform_search,
+        # which only restarts the debounce — a burst of them dispatches one search
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(150)
+        self._debounce.timeout.connect(self._do_search)
         self.search_input.returnPressed.connect(self.perform_search)
+        self.search_input.textChanged.connect(self.perform_search)
         sf.addWidget(self.search_input)
 
         self.search_btn = SearchButton()
@@ -831,27 +1506,13 @@ class AuraStore(QWidget):
         chips_row = QHBoxLayout()
         chips_row.setSpacing(6)
         try_lbl = QLabel("Try:")
-        try_lbl.setStyleSheet(
-            "color:#2A3A5A; font-size:11px; font-family:'JetBrains Mono',monospace;"
-        )
+        try_lbl.setObjectName("TryLbl")
         chips_row.addWidget(try_lbl)
+        # One mapper routes every chip's click to _chip(tag) — no closure per chip
+        self.chip_mapper = QSignalMapper(self)
+        self.chip_mapper.mappedString.connect(self._chip)
         for tag in CHIPS:
-            b = QPushButton(tag)
-            b.setCursor(Qt.CursorShape.PointingHandCursor)
-            b.setFixedHeight(24)
-            b.setStyleSheet("""
-                QPushButton {
-                    background:#10112A; color:#3A4A7A;
-                    border:1px solid #1A1E40; border-radius:12px;
-                    padding:0 11px; font-size:11px;
-                    font-family:'JetBrains Mono',monospace;
-                }
-                QPushButton:hover {
-                    color:#4CC9F0; border-color:#4CC9F044; background:#14163A;
-                }
-            """)
-            b.clicked.connect(lambda _, t=tag: self._chip(t))
-            chips_row.addWidget(b)
+            chips_row.addWidget(self._make_chip(tag))
         chips_row.addStretch()
         root.addLayout(chips_row)
         root.addSpacing(10)
@@ -860,57 +1521,86 @@ class AuraStore(QWidget):
         self.status_lbl = QLabel(
             "Search Arch repos, AUR & offline Arch Wiki simultaneously."
         )
-        self.status_lbl.setStyleSheet(
-            "color:#1E2A4A; font-size:11px; font-family:'JetBrains Mono',monospace;"
-        )
+        self.status_lbl.setObjectName("Status")
         root.addWidget(self.status_lbl)
         root.addSpacing(8)
 
-        # ── SCROLL AREA ──────────────────────────────────
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.results_widget = QWidget()
-        self.results_widget.setStyleSheet("background:transparent;")
-        self.results_layout = QVBoxLayout(self.results_widget)
-        self.results_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.results_layout.setSpacing(10)
-        self.results_layout.setContentsMargins(0, 0, 6, 0)
-        self.scroll.setWidget(self.results_widget)
-        root.addWidget(self.scroll)
+        # ── RESULTS ──────────────────────────────────────
+        self.model = ResultsModel(self)
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.delegate = CardDelegate(self.list_view)
+        self.delegate.copy_clicked.connect(self._copy)
+        self.delegate.action_clicked.connect(self._on_action)
+        self.list_view.setItemDelegate(self.delegate)
+        # Every card is CARD_ROW_H tall, so the view can lay out rows without asking the delegate
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setMouseTracking(True)
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.list_view.verticalScrollBar().setSingleStep(24)
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.list_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.list_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.list_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        root.addWidget(self.list_view)
+
+        self.empty_lbl = QLabel("  😕  No results found. Try a different keyword.")
+        self.empty_lbl.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop)
+        self.empty_lbl.setObjectName("Empty")
+        self.empty_lbl.hide()
+        root.addWidget(self.empty_lbl, 1)
 
         # ── FOOTER ───────────────────────────────────────
         root.addSpacing(4)
         footer = QLabel("Powered by Arch Linux · AUR · Arch Wiki Offline  •  Aura Find")
         footer.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        footer.setStyleSheet(
-            "color:#141828; font-size:10px; font-family:'JetBrains Mono',monospace;"
-        )
+        footer.setObjectName("Footer")
         root.addWidget(footer)
 
     # ── helpers ──────────────────────────────────────────
 
+    def _make_chip(self, tag: str) -> QPushButton:
+        b = QPushButton(tag)
+        b.setProperty("class", "chip")   # styled by WINDOW_QSS
+        b.setCursor(Qt.CursorShape.PointingHandCursor)
+        b.setFixedHeight(24)
+        b.clicked.connect(self.chip_mapper.map)
+        self.chip_mapper.setMapping(b, tag)
+        return b
+
     def _chip(self, tag: str):
         self.search_input.setText(tag)
         self.perform_search()
 
     def _clear(self):
-        self._cards.clear()
-        for i in reversed(range(self.results_layout.count())):
-            w = self.results_layout.itemAt(i).widget()
-            if w:
-                w.deleteLater()
+        self.model.clear()
+        self.empty_lbl.hide()
+        self.list_view.show()
 
     def _stop_logo_worker(self):
-        if self.logo_worker and self.logo_worker.isRunning():
-            self.logo_worker.stop()
-            self.logo_worker.wait(300)
+        if self._logo_cancel:
+            self._logo_cancel.set()
+            # Drop the tasks that haven't started; running ones see the event and stay quiet
+            _LOGO_THREADS.clear()
+            self._logo_cancel = None
 
     # ── search ───────────────────────────────────────────
 
     def perform_search(self):
+        # Restarting the timer drops any search still pending from this burst
+        self._debounce.start()
+
+    def _do_search(self):
         query = self.search_input.text().strip()
         if not query:
             return
+        key = query.lower()
+
+        # Enter pressed again, or the chip for what is already listed — nothing to redo,
+        # unless a lookup failed last time and the list is only partial
+        if key == self._last_query and self.model.rowCount() and key in _SEARCH_CACHE:
+            return
+        self._last_query = key
 
         # Bump the ID — any in-flight worker with an old ID will be ignored
         self._search_id += 1
@@ -918,38 +1608,74 @@ class AuraStore(QWidget):
 
         self._stop_logo_worker()
         self._clear()
+
+        # Same query as the lookup still running — wait for it instead of asking twice
+        if key in _SEARCH_INFLIGHT:
+            _SEARCH_INFLIGHT[key].append(current_id)
+            self.search_btn.set_loading(True)
+            self.status_lbl.setText(f"Searching '{query}'…")
+            return
+
+        # Let a still-running search bail out before it emits
+        if self._search_cancel:
+            self._search_cancel.set()
+            _SEARCH_INFLIGHT.pop(self._search_query, None)
+            self._search_cancel = None
+            self._take_back_search()
+
+        cached = cached_results(key)
+        if cached is not None:
+            self._on_results(current_id, cached)
+            return
+
         self.search_btn.set_loading(True)
         self.status_lbl.setText(f"Searching '{query}'…")
 
-        self.search_worker = SearchWorker(query, current_id)
-        self.search_worker.results_ready.connect(self._on_results)
-        self.search_worker.start()
+        _SEARCH_INFLIGHT[key] = [current_id]
+        self._search_cancel = threading.Event()
+        self._search_query = key
+        self._search_worker = SearchWorker(key, current_id, self._signals, self._search_cancel)
+        self._pool.start(self._search_worker)
+
+    def _take_back_search(self):
+        # Still waiting for a thread? Then it never gets one. (A finished worker
+        # has already been auto-deleted, so check before handing it to Qt.)
+        if self._search_worker is not None and not sip.isdeleted(self._search_worker):
+            self._pool.tryTake(self._search_worker)
+        self._search_worker = None
+
+    def _on_search_done(self, search_id: int, query: str, results: list, complete: bool):
+        # After a network error, searching again should retry instead of replaying this
+        if complete:
+            cache_results(query, results)
+        if query == self._search_query and self._search_cancel:
+            # Answered (possibly by an earlier, superseded run) — a rerun still going is redundant
+            self._search_cancel.set()
+            self._search_cancel = None
+            self._take_back_search()
+        # Hand the results to every search that was waiting on this lookup
+        for waiting_id in _SEARCH_INFLIGHT.pop(query, [search_id]):
+            self._on_results(waiting_id, results)
 
     def _on_results(self, search_id: int, results: list):
         # DISCARD if this belongs to an older search
         if search_id != self._search_id:
             return
 
-        self._clear()
-
         if not results:
-            msg = QLabel("  😕  No results found. Try a different keyword.")
-            msg.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            msg.setStyleSheet(
-                "color:#2A3A5A; font-size:15px;"
-                "font-family:'JetBrains Mono',monospace; padding:60px;"
-            )
-            self.results_layout.addWidget(msg)
+            self._clear()
+            self.list_view.hide()
+            self.empty_lbl.show()
             self.status_lbl.setText("No packages found.")
         else:
-            for pkg in results:
-                card = AppCard(
-                    pkg["name"], pkg["repo"], pkg["desc"],
-                    pkg.get("source", "online"),
-                    parent_window=self
-                )
-                self.results_layout.addWidget(card)
-                self._cards[pkg["name"].lower()] = card
+            # One model reset swaps in the new rows — no separate clear first.
+            # Updates stay off until the view is shown and scrolled, so it paints once.
+            self.list_view.setUpdatesEnabled(False)
+            self.empty_lbl.hide()
+            self.list_view.show()
+            self.model.set_packages(results)
+            self.list_view.scrollToTop()
+            self.list_view.setUpdatesEnabled(True)
 
             n = len(results)
             self.status_lbl.setText(
@@ -961,17 +1687,67 @@ class AuraStore(QWidget):
         self.search_btn.set_loading(False)
 
     def _start_logos(self, names: list, search_id: int):
-        self.logo_worker = LogoWorker(names, search_id)
-        self.logo_worker.logo_ready.connect(self._on_logo)
-        self.logo_worker.start()
+        # Logos shown earlier this session go straight onto their rows; only the rest hit the pool
+        pending = []
+        for name in names:
+            rounded = QPixmapCache.find(f"logo:{name_key(name)}")
+            if rounded is not None:
+                self.model.update(name, logo=rounded)
+                continue
+            px = cached_logo(name)
+            if px is None:
+                pending.append(name)
+            else:
+                self._show_logo(name, px)
+        if pending:
+            self._logo_cancel = start_logo_tasks(pending, search_id, self._signals)
 
-    def _on_logo(self, search_id: int, name: str, px: QPixmap):
-        # DISCARD logo if it's from a stale search
+    def _on_logos(self, search_id: int, batch: LogoBatch):
+        # DISCARD logos if they're from a stale search
         if search_id != self._search_id:
             return
-        card = self._cards.get(name.lower())
-        if card:
-            card.set_logo(px)
+        items = batch.take()
+        if not items:
+            return   # already picked up with an earlier signal
+        # Repaint once for the whole group, not once per row
+        self.list_view.setUpdatesEnabled(False)
+        for name, px in items:
+            self._show_logo(name, px)
+        self.list_view.setUpdatesEnabled(True)
+
+    def _show_logo(self, name: str, px: QPixmap):
+        # QPixmapCache is GUI-thread only, so the finished, rounded logo is cached here
+        rounded = rounded_pixmap(px, 48, 12)
+        QPixmapCache.insert(f"logo:{name_key(name)}", rounded)
+        self.model.update(name, logo=rounded)
+
+    # ── card buttons ─────────────────────────────────────
+
+    def _copy(self, name: str):
+        pkg = self.model.find(name)
+        if pkg is None:
+            return
+        QApplication.clipboard().setText(install_cmd(pkg))
+        self.model.update(name, copied=True)
+        QTimer.singleShot(1500, lambda: self.model.update(name, copied=False))
+
+    def _on_action(self, name: str):
+        pkg = self.model.find(name)
+        if pkg is None:
+            return
+        uninstall = pkg["installed"]
+        is_aur = pkg["repo"].upper() == "AUR"
+        dlg = PkgDialog(name, is_aur, uninstall=uninstall, parent=self)
+        self.model.update(name, busy="Uninstalling…" if uninstall else "Installing…")
+        dlg.worker.finished_ok.connect(lambda ok: self._action_done(name, uninstall, ok), Qt.ConnectionType.QueuedConnection)
+        dlg.show()
+
+    def _action_done(self, name: str, uninstall: bool, success: bool):
+        invalidate_installed()
+        changes = {"busy": None}
+        if success:
+            changes["installed"] = not uninstall
+        self.model.update(name, **changes)
 
 
 # ══════════════════════════════════════════════════════
@@ -980,13 +1756,45 @@ class AuraStore(QWidget):
 #  STARTUP PASSWORD DIALOG
 # ══════════════════════════════════════════════════════
 
+class AuthSignals(QObject):
+    auth_done = pyqtSignal(str)   # "ok" | "wrong" | "timeout"
+
+
+class SudoAuthRunnable(QRunnable):
+    """Check a sudo password off the UI thread — sudo can take seconds to answer."""
+
+    def __init__(self, pw: str, signals: AuthSignals):
+        super().__init__()
+        self.pw = pw
+        self.signals = signals
+        self.setAutoDelete(True)
+
+    def run(self):
+        # Validate: run `sudo -S true` with the given password
+        try:
+            proc = subprocess.run(
+                ["sudo", "-S", "-k", "true"],
+                input=self.pw + "\n",
+                capture_output=True,
+                text=True,
+                timeout=8
+            )
+            result = "ok" if proc.returncode == 0 else "wrong"
+        except subprocess.TimeoutExpired:
+            result = "timeout"
+        except FileNotFoundError:
+            # sudo not found — not on Linux, skip silently
+            result = "ok"
+        self.signals.auth_done.emit(result)
+
+
 class PasswordDialog(QDialog):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Aura Find — Authentication")
         self.setFixedSize(440, 260)
         self.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.FramelessWindowHint)
-        self.setStyleSheet("QDialog { background:#0A0B18; border:1px solid #1E2040; border-radius:16px; }")
+        self.setStyleSheet(PASSWORD_DIALOG_QSS)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 28, 30, 24)
@@ -994,20 +1802,14 @@ class PasswordDialog(QDialog):
 
         # Icon + title
         title = QLabel("🔐  Enter your password")
-        title.setStyleSheet(
-            "font-family:'JetBrains Mono',monospace; font-size:17px;"
-            "font-weight:bold; color:#DDE2FF;"
-        )
+        title.setObjectName("PwTitle")
         layout.addWidget(title)
 
         subtitle = QLabel(
             "Aura Find needs your sudo password once to install\n"
             "and uninstall packages without asking again."
         )
-        subtitle.setStyleSheet(
-            "font-size:12px; color:#445577;"
-            "font-family:'Segoe UI','Ubuntu',sans-serif;"
-        )
+        subtitle.setObjectName("PwSubtitle")
         layout.addWidget(subtitle)
 
         # Password field
@@ -1015,23 +1817,13 @@ class PasswordDialog(QDialog):
         self.pw_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.pw_input.setPlaceholderText("sudo password…")
         self.pw_input.setFixedHeight(44)
-        self.pw_input.setStyleSheet("""
-            QLineEdit {
-                background:#10112A; color:#DDE2FF;
-                border:1px solid #2A2E50; border-radius:10px;
-                font-size:14px; padding:0 14px;
-                font-family:'Segoe UI','Ubuntu',sans-serif;
-            }
-            QLineEdit:focus { border-color:#4CC9F0; }
-        """)
+        self.pw_input.setObjectName("Password")
         self.pw_input.returnPressed.connect(self._try_auth)
         layout.addWidget(self.pw_input)
 
         # Error label (hidden until needed)
         self.error_lbl = QLabel("")
-        self.error_lbl.setStyleSheet(
-            "color:#CC4444; font-size:11px; font-family:'JetBrains Mono',monospace;"
-        )
+        self.error_lbl.setObjectName("PwError")
         layout.addWidget(self.error_lbl)
 
         # Buttons
@@ -1041,40 +1833,28 @@ class PasswordDialog(QDialog):
         skip_btn = QPushButton("Skip (install won\'t work)")
         skip_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         skip_btn.setFixedHeight(36)
-        skip_btn.setStyleSheet("""
-            QPushButton {
-                background:transparent; color:#334466;
-                border:1px solid #1E2040; border-radius:9px;
-                font-size:11px; padding:0 14px;
-            }
-            QPushButton:hover { color:#4CC9F0; border-color:#4CC9F033; }
-        """)
+        skip_btn.setObjectName("Skip")
         skip_btn.clicked.connect(self.reject)
 
         self.auth_btn = QPushButton("  Unlock  ")
         self.auth_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.auth_btn.setFixedHeight(36)
-        self.auth_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
-                    stop:0 #4361EE, stop:1 #4CC9F0);
-                color:white; font-weight:bold; font-size:13px;
-                font-family:'JetBrains Mono',monospace;
-                border-radius:9px; border:none; padding:0 20px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
-                    stop:0 #5572FF, stop:1 #5DD8FA);
-            }
-        """)
+        self.auth_btn.setObjectName("Unlock")
         self.auth_btn.clicked.connect(self._try_auth)
 
+        self._pending_pw = ""
+        self._auth_signals = AuthSignals(self)
+        self._auth_signals.auth_done.connect(self._auth_done, Qt.ConnectionType.QueuedConnection)
+
         btn_row.addWidget(skip_btn)
         btn_row.addStretch()
         btn_row.addWidget(self.auth_btn)
         layout.addLayout(btn_row)
 
     def _try_auth(self):
+        # Enter while a check is already running
+        if not self.auth_btn.isEnabled():
+            return
         pw = self.pw_input.text()
         if not pw:
             self.error_lbl.setText("Please enter your password.")
@@ -1082,67 +1862,94 @@ class PasswordDialog(QDialog):
 
         self.auth_btn.setEnabled(False)
         self.auth_btn.setText("Checking…")
-        QApplication.processEvents()
+        self._pending_pw = pw
+        QThreadPool.globalInstance().start(SudoAuthRunnable(pw, self._auth_signals))
 
-        # Validate: run `sudo -S true` with the given password
-        try:
-            proc = subprocess.run(
-                ["sudo", "-S", "-k", "true"],
-                input=pw + "\n",
-                capture_output=True,
-                text=True,
-                timeout=8
-            )
-            if proc.returncode == 0:
-                set_sudo_password(pw)
-                self.accept()
-            else:
-                self.error_lbl.setText("❌  Wrong password. Try again.")
-                self.pw_input.clear()
-                self.pw_input.setFocus()
-                self.auth_btn.setEnabled(True)
-                self.auth_btn.setText("  Unlock  ")
-        except subprocess.TimeoutExpired:
-            self.error_lbl.setText("❌  Timed out. Try again.")
-            self.auth_btn.setEnabled(True)
-            self.auth_btn.setText("  Unlock  ")
-        except FileNotFoundError:
-            # sudo not found — not on Linux, skip silently
-            set_sudo_password(pw)
+    def _auth_done(self, result: str):
+        # Skipped while the check was running
+        if not self.isVisible():
+            return
+        if result == "ok":
+            set_sudo_password(self._pending_pw)
             self.accept()
+            return
+        if result == "wrong":
+            self.error_lbl.setText("❌  Wrong password. Try again.")
+            self.pw_input.clear()
+            self.pw_input.setFocus()
+        else:
+            self.error_lbl.setText("❌  Timed out. Try again.")
+        self._pending_pw = ""
+        self.auth_btn.setEnabled(True)
+        self.auth_btn.setText("  Unlock  ")
 
 
-def start_sudo_keepalive():
-    """Refresh sudo timestamp every 4 minutes so it never expires."""
-    def refresh():
-        try:
-            subprocess.run(
-                ["sudo", "-S", "-v"],
-                input=_SUDO_PASSWORD + "\n",
-                capture_output=True,
-                text=True
-            )
-        except Exception:
-            pass
-    timer = QTimer()
-    timer.setInterval(4 * 60 * 1000)   # 4 minutes
-    timer.timeout.connect(refresh)
-    timer.start()
-    return timer   # keep reference alive
+class SudoKeepalive(QObject):
+    """Refresh the sudo timestamp every 4 minutes so it never expires.
+
+    Each refresh is a QProcess driven by signals, so nothing blocks the UI thread.
+    The timer stops while the app is in the background, unless a package job
+    still needs sudo.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.proc = QProcess(self)
+        # `sudo -v` prints nothing useful on stdout; only stderr is kept, for the failure message
+        self.proc.setStandardOutputFile(QProcess.nullDevice())
+        self.proc.started.connect(self._feed_password)
+        self.proc.finished.connect(self._finished)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(4 * 60 * 1000)   # 4 minutes
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start()
+        # The startup check runs `sudo -k`, which leaves no timestamp behind — set one now
+        self.refresh()
+        QApplication.instance().applicationStateChanged.connect(self._state_changed)
+
+    def refresh(self):
+        if self.proc.state() == QProcess.ProcessState.NotRunning:
+            self.proc.start("sudo", ["-S", "-v"])
+
+    def _feed_password(self):
+        self.proc.write((_SUDO_PASSWORD + "\n").encode())
+        self.proc.closeWriteChannel()
+
+    def _finished(self, code: int, status):
+        errors = self.proc.readAllStandardError()
+        if code != 0 or status != QProcess.ExitStatus.NormalExit:
+            output = bytes(errors).decode("utf-8", "replace").strip()
+            print(f"sudo keepalive failed ({code}): {output}", file=sys.stderr)
+
+    def _state_changed(self, state):
+        if state == Qt.ApplicationState.ApplicationActive:
+            if not self.timer.isActive():
+                # The timestamp may have lapsed while we were away
+                self.refresh()
+                self.timer.start()
+        elif not any(w.isRunning() for w in PkgWorker.live):
+            self.timer.stop()
+
+
+def start_sudo_keepalive() -> SudoKeepalive:
+    return SudoKeepalive(QApplication.instance())
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    # Don't leave a package job's process running after the window is gone
+    app.aboutToQuit.connect(PkgWorker.stop_all)
 
     # Ask for password once at startup
     pw_dlg = PasswordDialog()
     pw_dlg.exec()   # blocks until accepted or skipped
 
     # Keep sudo alive in background if authenticated
-    _keepalive_timer = None
+    _keepalive = None
     if _SUDO_PASSWORD:
-        _keepalive_timer = start_sudo_keepalive()
+        _keepalive = start_sudo_keepalive()
 
     win = AuraStore()
     win.show()
@@ -1,25 +1,37 @@
-import json
 import sys
 import os
+from functools import lru_cache
 
-def search_arch_wiki(query):
+@lru_cache(maxsize=1)
+def _load_db():
+    """Parse real_db.json once into its list of apps; None if it's missing."""
     script_dir = os.path.dirname(os.path.realpath(__file__))
     json_path = os.path.join(script_dir, "data", "real_db.json")
 
+    # Only needed for the wiki search, so the usage message shown without arguments never pays for it
+    import json
     try:
         with open(json_path, "r", encoding="utf-8") as f:
             db = json.load(f)
     except FileNotFoundError:
+        return None
+
+    apps = db.get("apps", [])
+    for app in apps:
+        # Lowercased once here so a scan is one `in` per app; NULs keep matches from spanning fields
+        app["_search_blob"] = f"{app['name']}\x00{app['desc']}\x00{app['category']}".lower()
+    return apps
+
+def search_arch_wiki(query):
+    apps = _load_db()
+    if apps is None:
         print("Error: Run build_db.py first to generate the database.")
         return
 
     query = query.lower()
-    results = []
 
     # Search through every app's name, description, and category
-    for app in db.get("apps", []):
-        if (query in app["name"]) or (query in app["desc"].lower()) or (query in app["category"].lower()):
-            results.append(app)
+    results = [app for app in apps if query in app["_search_blob"]]
 
     if results:
         print(f"\nFound {len(results)} offline results for '{query}':")